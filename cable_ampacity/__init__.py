@@ -7,16 +7,24 @@ Phase 1: Single cable, direct buried, XLPE insulation.
 
 from .ac_resistance import calculate_ac_resistance
 from .losses import calculate_losses
-from .thermal_resistance import calculate_thermal_resistances
-from .solver import calculate_ampacity
-from .report_generator import generate_qaqc_report, ReportConfig
+from .thermal_resistance import (
+    calculate_thermal_resistances,
+    calculate_thermal_resistances_batch,
+    calculate_thermal_resistances_grid,
+)
+from .solver import calculate_ampacity, calculate_ampacity_batch
+from .report_generator import generate_qaqc_report, generate_qaqc_reports_batch, ReportConfig
 
 __version__ = "0.1.0"
 __all__ = [
     "calculate_ac_resistance",
     "calculate_losses",
     "calculate_thermal_resistances",
+    "calculate_thermal_resistances_batch",
+    "calculate_thermal_resistances_grid",
     "calculate_ampacity",
+    "calculate_ampacity_batch",
     "generate_qaqc_report",
+    "generate_qaqc_reports_batch",
     "ReportConfig",
 ]
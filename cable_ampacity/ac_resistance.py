@@ -21,7 +21,7 @@ The relationship is: α₂₀ = 1 / (BETA + 20) where BETA is at 0°C reference.
 
 import math
 from dataclasses import dataclass
-from typing import Literal, Optional
+from typing import Literal, NamedTuple, Optional
 
 
 # Material constants
@@ -177,7 +177,23 @@ IEC_TABLE_4_SOLAR_ABSORPTION = {
     "lead": 0.6,
 }
 
-@dataclass
+class AcResistanceResult(NamedTuple):
+    """AC resistance breakdown returned by calculate_ac_resistance.
+
+    Read fields by attribute (result.rac) or unpack it as a tuple; use
+    to_dict() where a plain dict is needed.
+    """
+    rdc: float                    # DC resistance (ohm/m)
+    ycs: float                    # Skin effect factor
+    ycp: float                    # Proximity effect factor
+    rac: float                    # AC resistance (ohm/m)
+
+    def to_dict(self) -> dict:
+        """Return the result as a plain dict (for JSON/API callers)."""
+        return self._asdict()
+
+
+@dataclass(slots=True)
 class ConductorSpec:
     """Specification for cable conductor.
 
@@ -316,16 +332,16 @@ def calculate_proximity_effect(
 
     # xp² = (8πf / R'dc) × 10^-7 × kp  (IEC 60287-1-1:2023, Clause 5.1.4/5.1.5)
     xp_squared = (8 * math.pi * frequency / rdc) * 1e-7 * kp
-    xp = math.sqrt(xp_squared)
 
     # F(xp) function per IEC 60287-1-1:2023
     # IMPORTANT: For proximity effect, F(xp) = xp⁴ / (192 + 0.8·xp⁴) for ALL xp values
     # (The piecewise approximation is only for skin effect, NOT proximity effect)
-    xp_4 = xp ** 4
+    xp_4 = xp_squared * xp_squared
     f_xp = xp_4 / (192 + 0.8 * xp_4)
 
-    # Diameter to spacing ratio
+    # Diameter to spacing ratio (squared form is all the formulas need)
     dc_s_ratio = dc / s
+    dc_s_sq = dc_s_ratio * dc_s_ratio
 
     # Select coefficient based on number of cables per circuit
     # IEC 60287-1-1:2023 Section 5.1.4: Two single-core cables -> 1.18
@@ -338,13 +354,13 @@ def calculate_proximity_effect(
 
     if arrangement == "trefoil":
         # Trefoil: Ycp = F(xp) × (dc/s)² × [0.312 × (dc/s)² + coeff / (F(xp) + 0.27)]
-        ycp = f_xp * (dc_s_ratio ** 2) * (0.312 * (dc_s_ratio ** 2) + coeff / (f_xp + 0.27))
+        ycp = f_xp * dc_s_sq * (0.312 * dc_s_sq + coeff / (f_xp + 0.27))
     else:
         # Flat formation per IEC 60287-1-1:2023 Section 5.1.5.2
         # For outer cables: same formula
         # For center cable: multiply by 2 (two adjacent cables)
         # Average effect: multiply by factor ~1.33 (average of 1, 2, 1 for 3 cables)
-        ycp = f_xp * (dc_s_ratio ** 2) * (0.312 * (dc_s_ratio ** 2) + coeff / (f_xp + 0.27))
+        ycp = f_xp * dc_s_sq * (0.312 * dc_s_sq + coeff / (f_xp + 0.27))
         ycp *= 4/3  # Average factor for flat formation (outer=1, center=2, outer=1) / 3
 
     return max(0, ycp)
@@ -356,7 +372,7 @@ def calculate_ac_resistance(
     spacing: float = 0.0,
     frequency: float = 50.0,
     arrangement: Literal["flat", "trefoil"] = "trefoil",
-) -> dict:
+) -> AcResistanceResult:
     """
     Calculate AC resistance including skin and proximity effects.
 
@@ -368,7 +384,7 @@ def calculate_ac_resistance(
         arrangement: Cable arrangement
 
     Returns:
-        Dictionary with:
+        AcResistanceResult with:
         - rdc: DC resistance (ohm/m)
         - ycs: Skin effect factor
         - ycp: Proximity effect factor
@@ -381,9 +397,4 @@ def calculate_ac_resistance(
     # Rac = Rdc × (1 + Ycs + Ycp)
     rac = rdc * (1 + ycs + ycp)
 
-    return {
-        "rdc": rdc,
-        "ycs": ycs,
-        "ycp": ycp,
-        "rac": rac,
-    }
+    return AcResistanceResult(rdc, ycs, ycp, rac)
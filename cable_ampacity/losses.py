@@ -11,7 +11,7 @@ Based on IEC 60287-1-1 and Neher-McGrath method.
 
 import math
 from dataclasses import dataclass
-from typing import Literal, Optional
+from typing import List, Literal, NamedTuple, Optional, Sequence, Tuple, Union
 
 
 # Dielectric properties - defaults per CYMCAP/manufacturer typical values
@@ -23,6 +23,9 @@ INSULATION_PROPERTIES = {
     "paper_oil": (0.0035, 3.5),    # Impregnated paper
 }
 
+# Permittivity of free space (F/m)
+EPSILON_0 = 8.854e-12
+
 # Maximum operating temperatures (°C)
 MAX_CONDUCTOR_TEMP = {
     "xlpe": 90,
@@ -31,7 +34,24 @@ MAX_CONDUCTOR_TEMP = {
 }
 
 
-@dataclass
+class LossResult(NamedTuple):
+    """Loss breakdown returned by calculate_losses.
+
+    Read fields by attribute (result.wc) or unpack it as a tuple; use
+    to_dict() where a plain dict is needed.
+    """
+    wc: float                     # Conductor losses (W/m)
+    wd: float                     # Dielectric losses (W/m)
+    ws: float                     # Shield losses (W/m)
+    lambda1: float                # Shield loss factor
+    total: float                  # Total losses (W/m)
+
+    def to_dict(self) -> dict:
+        """Return the result as a plain dict (for JSON/API callers)."""
+        return self._asdict()
+
+
+@dataclass(slots=True)
 class InsulationSpec:
     """Specification for cable insulation.
 
@@ -46,7 +66,7 @@ class InsulationSpec:
     thermal_resistivity: Optional[float] = None  # K.m/W (override default, e.g., 3.5 for XLPE)
 
 
-@dataclass
+@dataclass(slots=True)
 class ShieldSpec:
     """Specification for cable shield/sheath."""
     material: Literal["copper", "aluminum", "lead"]
@@ -57,6 +77,25 @@ class ShieldSpec:
     bonding: Literal["single_point", "both_ends", "cross_bonded"] = "single_point"
 
 
+def get_dielectric_properties(insulation: InsulationSpec) -> Tuple[float, float]:
+    """
+    Get the dielectric properties of an insulation.
+
+    Values set on the specification override the material defaults.
+
+    Args:
+        insulation: Insulation specification
+
+    Returns:
+        Tuple of (tan_delta, relative permittivity)
+    """
+    default_tan_delta, default_permittivity = INSULATION_PROPERTIES[insulation.material]
+    return (
+        insulation.tan_delta or default_tan_delta,
+        insulation.permittivity or default_permittivity,
+    )
+
+
 def calculate_dielectric_loss(
     insulation: InsulationSpec,
     voltage: float,
@@ -76,20 +115,17 @@ def calculate_dielectric_loss(
         Dielectric loss in W/m
     """
     # Get material properties
-    default_tan_delta, default_permittivity = INSULATION_PROPERTIES[insulation.material]
-    tan_delta = insulation.tan_delta or default_tan_delta
-    epsilon_r = insulation.permittivity or default_permittivity
+    tan_delta, epsilon_r = get_dielectric_properties(insulation)
 
     # Capacitance per unit length (F/m)
     # C = 2πε₀εᵣ / ln(D_i / d_c)
-    epsilon_0 = 8.854e-12  # F/m
     d_c = insulation.conductor_diameter  # mm
     d_i = insulation.conductor_diameter + 2 * insulation.thickness  # mm
 
     if d_i <= d_c:
         raise ValueError("Insulation outer diameter must be greater than conductor diameter")
 
-    capacitance = (2 * math.pi * epsilon_0 * epsilon_r) / math.log(d_i / d_c)
+    capacitance = (2 * math.pi * EPSILON_0 * epsilon_r) / math.log(d_i / d_c)
 
     # Angular frequency
     omega = 2 * math.pi * frequency
@@ -103,6 +139,24 @@ def calculate_dielectric_loss(
     return wd
 
 
+def _circulating_current_loss_factor(rs: float, xs: float, conductor_rac: float) -> float:
+    """
+    Circulating current loss factor λ1' = Rs/Rac × 1/(1 + (Rs/Xs)²).
+
+    Args:
+        rs: Shield resistance (ohm/m)
+        xs: Shield reactance (ohm/m)
+        conductor_rac: Conductor AC resistance (ohm/m)
+
+    Returns:
+        λ1' before any cross-bonding reduction (0 when Xs is not positive)
+    """
+    if xs <= 0:
+        return 0
+    rs_xs_ratio = rs / xs
+    return (rs / conductor_rac) * (1 / (1 + rs_xs_ratio ** 2))
+
+
 def calculate_shield_loss_factor(
     shield: ShieldSpec,
     conductor_rac: float,
@@ -143,12 +197,7 @@ def calculate_shield_loss_factor(
     xs = 2 * math.pi * frequency * 2e-7 * math.log(2 * s / d_s) * 1000  # ohm/km to ohm/m
 
     # Circulating current loss factor
-    # λ1' = Rs/Rac × 1/(1 + (Rs/Xs)²)
-    if xs > 0:
-        rs_xs_ratio = rs / xs
-        lambda1_cc = (rs / conductor_rac) * (1 / (1 + rs_xs_ratio ** 2))
-    else:
-        lambda1_cc = 0
+    lambda1_cc = _circulating_current_loss_factor(rs, xs, conductor_rac)
 
     # Eddy current loss factor
     lambda1_ec = calculate_eddy_current_loss_factor(shield, conductor_rac, spacing, frequency)
@@ -160,6 +209,62 @@ def calculate_shield_loss_factor(
     return lambda1_cc + lambda1_ec
 
 
+def calculate_shield_loss_factor_batch(
+    shield: ShieldSpec,
+    conductor_rac: Union[float, Sequence[float]],
+    spacing: float,
+    frequencies: Sequence[float],
+    temperature: float = 75.0,
+) -> List[float]:
+    """
+    Calculate shield loss factor (λ1) for several frequencies at once.
+
+    Intended for harmonic studies (e.g. 60, 180, 300 Hz, ...). Shield
+    resistance and the ln(2s/d) geometry term do not depend on frequency, so
+    they are evaluated once instead of per harmonic. Each entry matches
+    calculate_shield_loss_factor() at that frequency.
+
+    Args:
+        shield: Shield specification
+        conductor_rac: Conductor AC resistance (ohm/m), either one value for
+            all frequencies or one value per frequency
+        spacing: Axial spacing between conductors in mm
+        frequencies: System/harmonic frequencies in Hz
+        temperature: Shield operating temperature in °C
+
+    Returns:
+        List of shield loss factors λ1, one per frequency
+    """
+    n = len(frequencies)
+    if isinstance(conductor_rac, (int, float)):
+        rac_values = [conductor_rac] * n
+    else:
+        rac_values = list(conductor_rac)
+        if len(rac_values) != n:
+            raise ValueError("conductor_rac must be a scalar or match the number of frequencies")
+
+    if shield.bonding == "single_point":
+        return [
+            calculate_eddy_current_loss_factor(shield, rac, spacing, frequency)
+            for frequency, rac in zip(frequencies, rac_values)
+        ]
+
+    rs = calculate_shield_resistance(shield, temperature)
+
+    d_s = shield.mean_diameter  # mm
+    s = spacing if spacing > 0 else d_s * 2
+    xs_per_hz = 2 * math.pi * 2e-7 * math.log(2 * s / d_s) * 1000
+    cc_factor = 0.1 if shield.bonding == "cross_bonded" else 1.0
+
+    factors = []
+    for frequency, rac in zip(frequencies, rac_values):
+        lambda1_cc = _circulating_current_loss_factor(rs, xs_per_hz * frequency, rac)
+        lambda1_ec = calculate_eddy_current_loss_factor(shield, rac, spacing, frequency)
+        factors.append(lambda1_cc * cc_factor + lambda1_ec)
+
+    return factors
+
+
 def calculate_eddy_current_loss_factor(
     shield: ShieldSpec,
     conductor_rac: float,
@@ -246,7 +351,7 @@ def calculate_losses(
     shield: Optional[ShieldSpec] = None,
     spacing: float = 0.0,
     frequency: float = 50.0,
-) -> dict:
+) -> LossResult:
     """
     Calculate all cable losses.
 
@@ -260,7 +365,7 @@ def calculate_losses(
         frequency: System frequency in Hz
 
     Returns:
-        Dictionary with:
+        LossResult with:
         - wc: Conductor losses (W/m)
         - wd: Dielectric losses (W/m)
         - ws: Shield losses (W/m)
@@ -283,10 +388,4 @@ def calculate_losses(
 
     total = wc + wd + ws
 
-    return {
-        "wc": wc,
-        "wd": wd,
-        "ws": ws,
-        "lambda1": lambda1,
-        "total": total,
-    }
+    return LossResult(wc, wd, ws, lambda1, total)
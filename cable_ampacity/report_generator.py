@@ -8,15 +8,18 @@ Implements report format per IEC 60287-1-1:2023 and IEC 60287-2-1:2023.
 """
 
 import math
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Union, Optional, Dict, Any, List
+from functools import lru_cache
+from itertools import repeat
+from typing import Union, Optional, Dict, Any, Iterable, Iterator, List, Tuple
 
 from .ac_resistance import (
     ConductorSpec,
     TEMPERATURE_COEFFICIENT,
-    SKIN_EFFECT_CONSTANT,
-    PROXIMITY_EFFECT_CONSTANT,
     calculate_dc_resistance,
     calculate_skin_effect,
     calculate_proximity_effect,
@@ -24,8 +27,9 @@ from .ac_resistance import (
 from .losses import (
     InsulationSpec,
     ShieldSpec,
-    INSULATION_PROPERTIES,
+    EPSILON_0,
     calculate_dielectric_loss,
+    get_dielectric_properties,
     calculate_shield_loss_factor,
 )
 from .thermal_resistance import (
@@ -36,7 +40,16 @@ from .thermal_resistance import (
     THERMAL_RESISTIVITY,
     CONDUIT_THERMAL_RESISTIVITY,
 )
-from .solver import CableSpec, OperatingConditions
+from .solver import CableSpec, OperatingConditions, calculate_intermediate_values
+
+
+# Material property lookups bound once at import (the tables themselves are
+# shared with the calculation modules, so edits to them are still seen)
+_get_thermal_resistivity = THERMAL_RESISTIVITY.get
+_get_conduit_thermal_resistivity = CONDUIT_THERMAL_RESISTIVITY.get
+
+_TWO_PI = 2 * math.pi
+_INV_TWO_PI = 1 / _TWO_PI
 
 
 @dataclass
@@ -50,19 +63,25 @@ class ReportConfig:
     decimal_places: int = 4
 
 
-def _format_number(value: float, decimals: int = 4) -> str:
-    """Format a number with specified decimal places."""
-    if abs(value) < 1e-6:
-        return f"{value:.2e}"
-    elif abs(value) > 1e6:
-        return f"{value:.2e}"
-    else:
-        return f"{value:.{decimals}f}"
+# Display labels for material/option identifiers. The set of identifiers is
+# small and fixed, so the string munging is cached across reports.
+
+@lru_cache(maxsize=128)
+def _label_title(value: str) -> str:
+    """Display label in title case (e.g. 'single_point' -> 'Single Point')."""
+    return value.replace('_', ' ').title()
+
 
+@lru_cache(maxsize=128)
+def _label_upper(value: str) -> str:
+    """Display label in upper case (e.g. 'xlpe' -> 'XLPE')."""
+    return value.upper()
 
-def _format_scientific(value: float, sig_figs: int = 3) -> str:
-    """Format a number in scientific notation."""
-    return f"{value:.{sig_figs}e}"
+
+@lru_cache(maxsize=128)
+def _label_capitalize(value: str) -> str:
+    """Display label with first letter capitalized (e.g. 'copper' -> 'Copper')."""
+    return value.capitalize()
 
 
 def generate_qaqc_report(
@@ -87,95 +106,312 @@ def generate_qaqc_report(
     Returns:
         Path to the generated report
     """
+    sections = _iter_report_sections(cable_spec, installation, operating, results, config)
+
+    # Stream sections to the file as they are generated, so the full report
+    # text is never held in memory (bytes skip the text layer's encoder).
+    # They go to a temporary file next to output_path that replaces it only
+    # once every section has rendered, so a failure leaves any old report intact.
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            write = f.write
+            separator = b""
+            for section in sections:
+                write(separator)
+                write(section.encode("utf-8"))
+                separator = b"\n\n"
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    return output_path
+
+
+def generate_qaqc_reports_batch(
+    jobs: List[tuple],
+    config: Optional[ReportConfig] = None,
+    archive_path: Optional[str] = None,
+    max_workers: Optional[int] = None,
+) -> List[str]:
+    """
+    Generate QA/QC reports for many calculations (e.g. a parameter sweep).
+
+    Each job is a (cable_spec, installation, operating, results, output_path)
+    tuple. By default every report is written to its own output_path. If
+    archive_path is given, all reports are instead stored as members of a
+    single zip archive, named by their output_path, so a large sweep produces
+    one file rather than thousands of small ones.
+
+    Rendering is independent per job, so with max_workers > 1 the reports
+    are rendered in a process pool; files and the archive are still written
+    from the calling process, in job order.
+
+    Args:
+        jobs: List of (cable_spec, installation, operating, results, output_path)
+        config: Report configuration options (shared by all reports)
+        archive_path: Optional path of a zip archive to collect the reports
+        max_workers: Number of worker processes (None or 1 renders serially)
+
+    Returns:
+        List of written report paths (archive member names if archive_path is set)
+    """
+    if max_workers is not None and max_workers > 1 and len(jobs) > 1:
+        chunksize = max(1, len(jobs) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            reports = pool.map(_render_job, jobs, repeat(config), chunksize=chunksize)
+            return _write_reports(jobs, reports, archive_path)
+
+    reports = (_render_job(job, config) for job in jobs)
+    return _write_reports(jobs, reports, archive_path)
+
+
+def _render_job(job: tuple, config: Optional[ReportConfig]) -> bytes:
+    """Render one batch job (module level so it can run in a worker process)."""
+    cable_spec, installation, operating, results, _ = job
+    return _render_qaqc_report(cable_spec, installation, operating, results, config)
+
+
+def _write_reports(
+    jobs: List[tuple],
+    reports: Iterable[bytes],
+    archive_path: Optional[str],
+) -> List[str]:
+    """Write rendered batch reports to their paths or into one zip archive."""
+    names = [job[4] for job in jobs]
+
+    if archive_path is None:
+        for output_path, report_bytes in zip(names, reports):
+            with open(output_path, 'wb') as f:
+                f.write(report_bytes)
+        return names
+
+    with zipfile.ZipFile(archive_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for output_path, report_bytes in zip(names, reports):
+            archive.writestr(output_path, report_bytes)
+
+    return names
+
+
+def _render_qaqc_report(
+    cable_spec: CableSpec,
+    installation: Union[BurialConditions, ConduitConditions, DuctBankConditions],
+    operating: OperatingConditions,
+    results: dict,
+    config: Optional[ReportConfig] = None,
+) -> bytes:
+    """Render the full Markdown report as UTF-8 bytes."""
+    sections = _iter_report_sections(cable_spec, installation, operating, results, config)
+    return "\n\n".join(sections).encode("utf-8")
+
+
+def _iter_report_sections(
+    cable_spec: CableSpec,
+    installation: Union[BurialConditions, ConduitConditions, DuctBankConditions],
+    operating: OperatingConditions,
+    results: dict,
+    config: Optional[ReportConfig] = None,
+) -> Iterator[str]:
+    """Yield the report sections in order (joined by blank lines)."""
     if config is None:
         config = ReportConfig()
 
-    # Build report sections
-    sections = []
+    # Intermediate values shared across sections, computed once per report
+    derived = _derive_report_values(cable_spec, installation, operating, results)
 
     # Header
-    sections.append(_generate_header(config))
+    yield _generate_header(config)
 
     # Input Parameters
-    sections.append(_generate_input_section(cable_spec, installation, operating))
+    yield _generate_input_section(cable_spec, installation, operating, derived)
 
     # Calculation Sections
-    geometry = cable_spec.geometry
     conductor = cable_spec.conductor
     insulation = cable_spec.insulation
-
-    # Get temperature for calculations
-    max_temp = operating.max_conductor_temp or 90.0
+    max_temp = derived["max_temp"]
 
     # DC Resistance
-    sections.append(_generate_dc_resistance_section(
-        conductor, max_temp, results
-    ))
+    yield _generate_dc_resistance_section(
+        conductor, max_temp, derived
+    )
 
     # Skin Effect
-    sections.append(_generate_skin_effect_section(
-        conductor, results, operating.frequency
-    ))
+    yield _generate_skin_effect_section(
+        conductor, derived, operating.frequency
+    )
 
     # Proximity Effect
-    sections.append(_generate_proximity_effect_section(
-        conductor, results, operating.frequency, installation
-    ))
+    yield _generate_proximity_effect_section(
+        conductor, derived, operating.frequency
+    )
 
     # AC Resistance
-    sections.append(_generate_ac_resistance_section(results))
+    yield _generate_ac_resistance_section(derived)
 
     # Dielectric Loss
-    sections.append(_generate_dielectric_loss_section(
-        insulation, operating.voltage, operating.frequency, results
-    ))
+    yield _generate_dielectric_loss_section(
+        insulation, operating.voltage, operating.frequency, results, derived
+    )
 
     # Thermal Resistances
-    sections.append(_generate_thermal_resistance_section(
-        cable_spec, installation, results
-    ))
+    yield _generate_thermal_resistance_section(
+        cable_spec, installation, results, derived
+    )
 
     # Shield Loss Factor
     if cable_spec.shield:
-        sections.append(_generate_shield_loss_section(
+        yield _generate_shield_loss_section(
             cable_spec.shield, results
-        ))
+        )
 
     # Ampacity Calculation
-    sections.append(_generate_ampacity_section(
-        results, installation.ambient_temp, max_temp
-    ))
+    yield _generate_ampacity_section(
+        results, installation.ambient_temp, max_temp, derived
+    )
 
     # Results Summary Table
-    sections.append(_generate_results_summary(results, cable_spec))
+    yield _generate_results_summary(results, cable_spec, derived)
 
     # CYMCAP Comparison (if configured)
     if config.include_cymcap_comparison and config.cymcap_data:
-        sections.append(_generate_cymcap_comparison(results, config.cymcap_data))
+        yield _generate_cymcap_comparison(results, config.cymcap_data)
 
-    # Combine all sections
-    report_content = "\n\n".join(sections)
 
-    # Write to file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(report_content)
+def _derive_report_values(
+    cable_spec: CableSpec,
+    installation: Union[BurialConditions, ConduitConditions, DuctBankConditions],
+    operating: OperatingConditions,
+    results: dict,
+) -> Dict[str, Any]:
+    """
+    Collect the intermediate quantities shown in the report.
 
-    return output_path
+    The numeric values come from calculate_intermediate_values(); the
+    solver leaves them out so ampacity sweeps do not pay for report-only
+    quantities.
+    """
+    conductor = cable_spec.conductor
+    insulation = cable_spec.insulation
+    ac = results["ac_resistance"]
+    # Rating temperature used by the solver (insulation default when not overridden)
+    max_temp = results["max_conductor_temp"]
 
+    thermal_r = results["thermal_resistance"]
+    intermediate = calculate_intermediate_values(cable_spec, operating, results)
 
-def _generate_header(config: ReportConfig) -> str:
-    """Generate report header section."""
-    now = datetime.now()
+    # Axial spacing used for the proximity effect (mm)
+    if isinstance(installation, DuctBankConditions):
+        spacing = installation.duct_spacing_h * 1000  # m to mm
+    else:
+        spacing = installation.spacing * 1000
 
-    header = f"""# Cable Ampacity QA/QC Calculation Report
+    tan_delta, epsilon_r = get_dielectric_properties(insulation)
+
+    derived = dict(intermediate)
+    derived.update({
+        "max_temp": max_temp,
+        "geometry": cable_spec.geometry,
+        "rdc": ac["rdc"],
+        "ycs": ac["ycs"],
+        "ycp": ac["ycp"],
+        "rac": ac["rac"],
+        # Display-unit forms reused by several sections
+        "rdc_sci": f"{ac['rdc']:.3e}",
+        "rac_sci": f"{ac['rac']:.3e}",
+        "rdc_uohm": ac["rdc"] * 1e6,
+        "rac_uohm": ac["rac"] * 1e6,
+        "alpha": TEMPERATURE_COEFFICIENT[conductor.material],
+        "spacing": spacing,
+        "tan_delta": tan_delta,
+        "epsilon_0": EPSILON_0,
+        "epsilon_r": epsilon_r,
+        "d_c": insulation.conductor_diameter,
+        "d_i": insulation.conductor_diameter + 2 * insulation.thickness,
+        # Optional thermal layers are fixed by the installation; decide once
+        # which conditional subsections/rows the report needs
+        "has_conduit": thermal_r.get("r3_conduit", 0.0) > 0,
+        "has_concrete": thermal_r.get("r_concrete", 0.0) > 0,
+    })
+    return derived
+
+
+# Header and input tables are fixed layouts, so they are kept as
+# pre-built str.format templates filled from the spec objects.
+
+_HEADER_TEMPLATE = """# Cable Ampacity QA/QC Calculation Report
 
 ## {config.study_name}
 
 | Field | Value |
 |-------|-------|
-| Date Generated | {now.strftime('%Y-%m-%d %H:%M:%S')} |
+| Date Generated | {date} |
 | Software Version | {config.software_version} |
-| Standards Reference | IEC 60287-1-1:2023, IEC 60287-2-1:2023 |"""
+| Standards Reference | IEC 60287-1-1:2023, IEC 60287-2-1:2023 |""".format
+
+_INPUT_TABLE_HEADER = """| Parameter | Symbol | Value | Unit |
+|-----------|--------|-------|------|"""
+
+_CABLE_TABLE_TEMPLATE = ("""## Input Parameters
+
+### Cable Construction
+
+""" + _INPUT_TABLE_HEADER + """
+| Conductor Material | - | {material} | - |
+| Conductor Cross-Section | $A_c$ | {conductor.cross_section:.2f} | mm² |
+| Conductor Diameter | $d_c$ | {conductor.diameter:.2f} | mm |
+| Conductor Stranding | - | {stranding} | - |
+| Insulation Material | - | {insulation_material} | - |
+| Insulation Thickness | $t_{{ins}}$ | {insulation.thickness:.2f} | mm |
+| Conductor Shield Thickness | $t_{{cs}}$ | {cable.conductor_shield_thickness:.2f} | mm |
+| Insulation Screen Thickness | $t_{{is}}$ | {cable.insulation_screen_thickness:.2f} | mm |
+| Jacket Thickness | $t_j$ | {cable.jacket_thickness:.2f} | mm |
+| Overall Cable Diameter | $D_e$ | {overall_diameter:.2f} | mm |""").format
+
+_OPERATING_TABLE_TEMPLATE = ("""
+
+### Operating Conditions
+
+""" + _INPUT_TABLE_HEADER + """
+| System Voltage (L-G) | $U_0$ | {operating.voltage:.2f} | kV |
+| Frequency | $f$ | {operating.frequency:.0f} | Hz |
+| Maximum Conductor Temperature | $T_{{max}}$ | {max_temp:.0f} | °C |
+| Load Factor | $LF$ | {operating.load_factor:.2f} | - |
+
+### Installation Conditions
+
+""" + _INPUT_TABLE_HEADER + """
+| Installation Type | - | {install_type} | - |
+| Ambient Temperature | $T_{{amb}}$ | {installation.ambient_temp:.1f} | °C |
+| Soil Thermal Resistivity | $\\rho_{{soil}}$ | {installation.soil_resistivity:.2f} | K·m/W |""").format
+
+_CONDUIT_ROWS_TEMPLATE = """
+| Conduit Inner Diameter | $D_{{ci}}$ | {installation.conduit_id_mm:.2f} | mm |
+| Conduit Outer Diameter | $D_{{co}}$ | {installation.conduit_od_mm:.2f} | mm |
+| Conduit Material | - | {material} | - |
+| Burial Depth | $L$ | {installation.depth:.3f} | m |""".format
+
+_DUCT_BANK_ROWS_TEMPLATE = """
+| Duct Inner Diameter | $D_{{di}}$ | {installation.duct_id_mm:.2f} | mm |
+| Duct Outer Diameter | $D_{{do}}$ | {installation.duct_od_mm:.2f} | mm |
+| Duct Material | - | {material} | - |
+| Depth to Top of Duct Bank | $L$ | {installation.depth:.3f} | m |
+| Duct Bank Width | $W$ | {installation.bank_width:.3f} | m |
+| Duct Bank Height | $H$ | {installation.bank_height:.3f} | m |
+| Concrete Thermal Resistivity | $\\rho_{{conc}}$ | {installation.concrete_resistivity:.2f} | K·m/W |
+| Duct Array | - | {installation.duct_rows} × {installation.duct_cols} | rows × cols |""".format
+
+_BURIAL_ROWS_TEMPLATE = """
+| Burial Depth | $L$ | {installation.depth:.3f} | m |
+| Cable Spacing | $s$ | {spacing_mm:.0f} | mm |""".format
+
+
+def _generate_header(config: ReportConfig) -> str:
+    """Generate report header section."""
+    header = _HEADER_TEMPLATE(
+        config=config,
+        date=time.strftime('%Y-%m-%d %H:%M:%S'),
+    )
 
     if config.project_name:
         header += f"\n| Project | {config.project_name} |"
@@ -187,11 +423,11 @@ def _generate_input_section(
     cable_spec: CableSpec,
     installation: Union[BurialConditions, ConduitConditions, DuctBankConditions],
     operating: OperatingConditions,
+    derived: Dict[str, Any],
 ) -> str:
     """Generate input parameters section."""
     conductor = cable_spec.conductor
     insulation = cable_spec.insulation
-    geometry = cable_spec.geometry
 
     # Determine installation type
     if isinstance(installation, DuctBankConditions):
@@ -201,99 +437,66 @@ def _generate_input_section(
     else:
         install_type = "Direct Buried"
 
-    section = """## Input Parameters
-
-### Cable Construction
-
-| Parameter | Symbol | Value | Unit |
-|-----------|--------|-------|------|"""
-
-    section += f"""
-| Conductor Material | - | {conductor.material.capitalize()} | - |
-| Conductor Cross-Section | $A_c$ | {conductor.cross_section:.2f} | mm² |
-| Conductor Diameter | $d_c$ | {conductor.diameter:.2f} | mm |
-| Conductor Stranding | - | {conductor.stranding.replace('_', ' ').title()} | - |
-| Insulation Material | - | {insulation.material.upper()} | - |
-| Insulation Thickness | $t_{{ins}}$ | {insulation.thickness:.2f} | mm |
-| Conductor Shield Thickness | $t_{{cs}}$ | {cable_spec.conductor_shield_thickness:.2f} | mm |
-| Insulation Screen Thickness | $t_{{is}}$ | {cable_spec.insulation_screen_thickness:.2f} | mm |
-| Jacket Thickness | $t_j$ | {cable_spec.jacket_thickness:.2f} | mm |
-| Overall Cable Diameter | $D_e$ | {geometry.overall_diameter:.2f} | mm |"""
+    parts = [_CABLE_TABLE_TEMPLATE(
+        conductor=conductor,
+        insulation=insulation,
+        cable=cable_spec,
+        material=_label_capitalize(conductor.material),
+        stranding=_label_title(conductor.stranding),
+        insulation_material=_label_upper(insulation.material),
+        overall_diameter=derived["geometry"].overall_diameter,
+    )]
 
     if conductor.dc_resistance_20c:
-        section += f"""
-| DC Resistance at 20°C | $R_{{DC,20}}$ | {conductor.dc_resistance_20c*1e6:.4f} | μΩ/m |"""
+        parts.append(f"""
+| DC Resistance at 20°C | $R_{{DC,20}}$ | {conductor.dc_resistance_20c*1e6:.4f} | μΩ/m |""")
 
     if conductor.ks:
-        section += f"""
-| Skin Effect Coefficient | $k_s$ | {conductor.ks} | - |"""
+        parts.append(f"""
+| Skin Effect Coefficient | $k_s$ | {conductor.ks} | - |""")
 
     if conductor.kp:
-        section += f"""
-| Proximity Effect Coefficient | $k_p$ | {conductor.kp} | - |"""
-
-    section += """
-
-### Operating Conditions
-
-| Parameter | Symbol | Value | Unit |
-|-----------|--------|-------|------|"""
-
-    section += f"""
-| System Voltage (L-G) | $U_0$ | {operating.voltage:.2f} | kV |
-| Frequency | $f$ | {operating.frequency:.0f} | Hz |
-| Maximum Conductor Temperature | $T_{{max}}$ | {operating.max_conductor_temp or 90.0:.0f} | °C |
-| Load Factor | $LF$ | {operating.load_factor:.2f} | - |"""
-
-    section += """
-
-### Installation Conditions
-
-| Parameter | Symbol | Value | Unit |
-|-----------|--------|-------|------|"""
-
-    section += f"""
-| Installation Type | - | {install_type} | - |
-| Ambient Temperature | $T_{{amb}}$ | {installation.ambient_temp:.1f} | °C |
-| Soil Thermal Resistivity | $\\rho_{{soil}}$ | {installation.soil_resistivity:.2f} | K·m/W |"""
+        parts.append(f"""
+| Proximity Effect Coefficient | $k_p$ | {conductor.kp} | - |""")
+
+    parts.append(_OPERATING_TABLE_TEMPLATE(
+        operating=operating,
+        installation=installation,
+        max_temp=derived["max_temp"],
+        install_type=install_type,
+    ))
 
-    if isinstance(installation, (ConduitConditions, DuctBankConditions)):
-        if isinstance(installation, ConduitConditions):
-            section += f"""
-| Conduit Inner Diameter | $D_{{ci}}$ | {installation.conduit_id_mm:.2f} | mm |
-| Conduit Outer Diameter | $D_{{co}}$ | {installation.conduit_od_mm:.2f} | mm |
-| Conduit Material | - | {installation.conduit_material.upper()} | - |
-| Burial Depth | $L$ | {installation.depth:.3f} | m |"""
-        else:
-            section += f"""
-| Duct Inner Diameter | $D_{{di}}$ | {installation.duct_id_mm:.2f} | mm |
-| Duct Outer Diameter | $D_{{do}}$ | {installation.duct_od_mm:.2f} | mm |
-| Duct Material | - | {installation.duct_material.upper()} | - |
-| Depth to Top of Duct Bank | $L$ | {installation.depth:.3f} | m |
-| Duct Bank Width | $W$ | {installation.bank_width:.3f} | m |
-| Duct Bank Height | $H$ | {installation.bank_height:.3f} | m |
-| Concrete Thermal Resistivity | $\\rho_{{conc}}$ | {installation.concrete_resistivity:.2f} | K·m/W |
-| Duct Array | - | {installation.duct_rows} × {installation.duct_cols} | rows × cols |"""
+    if isinstance(installation, ConduitConditions):
+        parts.append(_CONDUIT_ROWS_TEMPLATE(
+            installation=installation,
+            material=_label_upper(installation.conduit_material),
+        ))
+    elif isinstance(installation, DuctBankConditions):
+        parts.append(_DUCT_BANK_ROWS_TEMPLATE(
+            installation=installation,
+            material=_label_upper(installation.duct_material),
+        ))
     else:
-        section += f"""
-| Burial Depth | $L$ | {installation.depth:.3f} | m |
-| Cable Spacing | $s$ | {installation.spacing*1000:.0f} | mm |"""
+        parts.append(_BURIAL_ROWS_TEMPLATE(
+            installation=installation,
+            spacing_mm=installation.spacing * 1000,
+        ))
 
-    return section
+    return "".join(parts)
 
 
 def _generate_dc_resistance_section(
     conductor: ConductorSpec,
     max_temp: float,
-    results: dict,
+    derived: Dict[str, Any],
 ) -> str:
     """Generate DC resistance calculation section."""
-    # Get values
-    alpha = TEMPERATURE_COEFFICIENT[conductor.material]
-    rdc_90 = results["ac_resistance"]["rdc"]
-
-    # Calculate R_DC at 20°C from the result (reverse calculation)
-    rdc_20 = rdc_90 / (1 + alpha * (max_temp - 20))
+    alpha = derived["alpha"]
+    rdc_90 = derived["rdc"]
+    rdc_20 = derived["rdc_20"]
+    temp_rise = max_temp - 20
+    rdc_20_sci = f"{rdc_20:.3e}"
+    rdc_90_sci = derived["rdc_sci"]
 
     section = f"""## 3.1 DC Resistance Calculation
 
@@ -310,43 +513,39 @@ $$R_{{DC}}(T) = R_{{DC}}(20°C) \\times [1 + \\alpha_{{20}} \\times (T - 20)]$$
 
 **Calculation:**
 ```
-R_DC(20°C) = {_format_scientific(rdc_20)} Ω/m
+R_DC(20°C) = {rdc_20_sci} Ω/m
            = {rdc_20 * 1609.34:.6f} Ω/mile
 
-R_DC({max_temp:.0f}°C) = {_format_scientific(rdc_20)} × [1 + {alpha} × ({max_temp:.0f} - 20)]
-           = {_format_scientific(rdc_20)} × [1 + {alpha} × {max_temp - 20:.0f}]
-           = {_format_scientific(rdc_20)} × {1 + alpha * (max_temp - 20):.4f}
-           = {_format_scientific(rdc_90)} Ω/m
+R_DC({max_temp:.0f}°C) = {rdc_20_sci} × [1 + {alpha} × ({max_temp:.0f} - 20)]
+           = {rdc_20_sci} × [1 + {alpha} × {temp_rise:.0f}]
+           = {rdc_20_sci} × {1 + alpha * temp_rise:.4f}
+           = {rdc_90_sci} Ω/m
            = {rdc_90 * 1609.34:.6f} Ω/mile
 ```
 
 **Result:**
-- $R_{{DC}}({max_temp:.0f}°C)$ = **{_format_scientific(rdc_90)} Ω/m** ({rdc_90 * 1e6:.4f} μΩ/m)"""
+- $R_{{DC}}({max_temp:.0f}°C)$ = **{rdc_90_sci} Ω/m** ({derived["rdc_uohm"]:.4f} μΩ/m)"""
 
     return section
 
 
 def _generate_skin_effect_section(
     conductor: ConductorSpec,
-    results: dict,
+    derived: Dict[str, Any],
     frequency: float,
 ) -> str:
     """Generate skin effect calculation section."""
-    rdc = results["ac_resistance"]["rdc"]
-    ycs = results["ac_resistance"]["ycs"]
-
-    # Get ks value
-    ks = conductor.ks if conductor.ks is not None else SKIN_EFFECT_CONSTANT.get(conductor.stranding, 1.0)
-
-    # Calculate xs
-    xs_squared = (8 * math.pi * frequency / rdc) * 1e-7 * ks
-    xs = math.sqrt(xs_squared)
+    ycs = derived["ycs"]
+    ks = derived["ks"]
+    xs_squared = derived["xs_squared"]
+    xs = derived["xs"]
+    rdc_sci = derived["rdc_sci"]
 
     # Determine formula used
     if xs <= 2.8:
         formula_range = "0 < $x_s$ ≤ 2.8"
         formula_tex = r"y_s = \frac{x_s^4}{192 + 0.8 \cdot x_s^4}"
-        xs_4 = xs ** 4
+        xs_4 = xs_squared * xs_squared
         formula_calc = f"""y_s = {xs_4:.4f} / (192 + 0.8 × {xs_4:.4f})
     = {xs_4:.4f} / {192 + 0.8 * xs_4:.4f}
     = {ycs:.4f}"""
@@ -371,13 +570,13 @@ $$x_s^2 = \\frac{{8\\pi f}}{{R'_{{DC}}}} \\times 10^{{-7}} \\times k_s$$
 
 **Where:**
 - $f$ = System frequency = {frequency:.0f} Hz
-- $R'_{{DC}}$ = DC resistance at max temperature = {_format_scientific(rdc)} Ω/m
-- $k_s$ = Skin effect coefficient = {ks} (Table 2, {conductor.stranding.replace('_', ' ').title()})
+- $R'_{{DC}}$ = DC resistance at max temperature = {rdc_sci} Ω/m
+- $k_s$ = Skin effect coefficient = {ks} (Table 2, {_label_title(conductor.stranding)})
 
 **Calculation of $x_s$:**
 ```
-x_s² = (8 × π × {frequency:.0f} / {_format_scientific(rdc)}) × 10⁻⁷ × {ks}
-     = {8 * math.pi * frequency / rdc:.4f} × 10⁻⁷ × {ks}
+x_s² = (8 × π × {frequency:.0f} / {rdc_sci}) × 10⁻⁷ × {ks}
+     = {derived["x_base"]:.4f} × 10⁻⁷ × {ks}
      = {xs_squared:.4f}
 
 x_s  = √({xs_squared:.4f})
@@ -401,24 +600,13 @@ $${formula_tex}$$
 
 def _generate_proximity_effect_section(
     conductor: ConductorSpec,
-    results: dict,
+    derived: Dict[str, Any],
     frequency: float,
-    installation: Union[BurialConditions, ConduitConditions, DuctBankConditions],
 ) -> str:
     """Generate proximity effect calculation section."""
-    rdc = results["ac_resistance"]["rdc"]
-    ycp = results["ac_resistance"]["ycp"]
-
-    # Get kp value
-    kp = conductor.kp if conductor.kp is not None else PROXIMITY_EFFECT_CONSTANT.get(conductor.stranding, 1.0)
-
-    # Get spacing
-    if isinstance(installation, DuctBankConditions):
-        spacing = installation.duct_spacing_h * 1000  # m to mm
-    elif isinstance(installation, ConduitConditions):
-        spacing = installation.spacing * 1000
-    else:
-        spacing = installation.spacing * 1000
+    ycp = derived["ycp"]
+    kp = derived["kp"]
+    spacing = derived["spacing"]
 
     dc = conductor.diameter
 
@@ -431,13 +619,13 @@ def _generate_proximity_effect_section(
 - $y_p$ = **{ycp:.4f}**"""
         return section
 
-    # Calculate xp
-    xp_squared = (8 * math.pi * frequency / rdc) * 1e-7 * kp
-    xp = math.sqrt(xp_squared)
+    xp_squared = derived["xp_squared"]
+    xp = derived["xp"]
+    rdc_sci = derived["rdc_sci"]
 
     # Calculate F(xp)
     if xp <= 2.8:
-        xp_4 = xp ** 4
+        xp_4 = xp_squared * xp_squared
         f_xp = xp_4 / (192 + 0.8 * xp_4)
         f_formula = r"F(x_p) = \frac{x_p^4}{192 + 0.8 \cdot x_p^4}"
     elif xp <= 3.8:
@@ -457,12 +645,12 @@ $$x_p^2 = \\frac{{8\\pi f}}{{R'_{{DC}}}} \\times 10^{{-7}} \\times k_p$$
 
 **Where:**
 - $f$ = System frequency = {frequency:.0f} Hz
-- $R'_{{DC}}$ = DC resistance at max temperature = {_format_scientific(rdc)} Ω/m
+- $R'_{{DC}}$ = DC resistance at max temperature = {rdc_sci} Ω/m
 - $k_p$ = Proximity effect coefficient = {kp}
 
 **Calculation of $x_p$:**
 ```
-x_p² = (8 × π × {frequency:.0f} / {_format_scientific(rdc)}) × 10⁻⁷ × {kp}
+x_p² = (8 × π × {frequency:.0f} / {rdc_sci}) × 10⁻⁷ × {kp}
      = {xp_squared:.4f}
 
 x_p  = √({xp_squared:.4f})
@@ -492,12 +680,15 @@ $$y_p = F(x_p) \\times \\left(\\frac{{d_c}}{{s}}\\right)^2 \\times \\left[0.312
     return section
 
 
-def _generate_ac_resistance_section(results: dict) -> str:
+def _generate_ac_resistance_section(derived: Dict[str, Any]) -> str:
     """Generate AC resistance calculation section."""
-    rdc = results["ac_resistance"]["rdc"]
-    ycs = results["ac_resistance"]["ycs"]
-    ycp = results["ac_resistance"]["ycp"]
-    rac = results["ac_resistance"]["rac"]
+    ycs = derived["ycs"]
+    ycp = derived["ycp"]
+    rac = derived["rac"]
+    ac_dc_ratio = 1 + ycs + ycp
+    rdc_sci = derived["rdc_sci"]
+    rac_sci = derived["rac_sci"]
+    rac_uohm = derived["rac_uohm"]
 
     section = f"""## 3.4 AC Resistance Calculation
 
@@ -509,16 +700,16 @@ $$R_{{AC}} = R_{{DC}} \\times (1 + y_s + y_p)$$
 
 **Calculation:**
 ```
-R_AC = {_format_scientific(rdc)} × (1 + {ycs:.4f} + {ycp:.4f})
-     = {_format_scientific(rdc)} × {1 + ycs + ycp:.4f}
-     = {_format_scientific(rac)} Ω/m
-     = {rac * 1e6:.4f} μΩ/m
+R_AC = {rdc_sci} × (1 + {ycs:.4f} + {ycp:.4f})
+     = {rdc_sci} × {ac_dc_ratio:.4f}
+     = {rac_sci} Ω/m
+     = {rac_uohm:.4f} μΩ/m
      = {rac * 1609.34:.6f} Ω/mile
 ```
 
 **Result:**
-- $R_{{AC}}$ = **{_format_scientific(rac)} Ω/m** ({rac * 1e6:.4f} μΩ/m)
-- AC/DC Ratio = **{1 + ycs + ycp:.4f}**"""
+- $R_{{AC}}$ = **{rac_sci} Ω/m** ({rac_uohm:.4f} μΩ/m)
+- AC/DC Ratio = **{ac_dc_ratio:.4f}**"""
 
     return section
 
@@ -528,23 +719,23 @@ def _generate_dielectric_loss_section(
     voltage: float,
     frequency: float,
     results: dict,
+    derived: Dict[str, Any],
 ) -> str:
     """Generate dielectric loss calculation section."""
     wd = results["losses"]["dielectric"]
 
-    # Get insulation properties
-    default_tan_delta, default_permittivity = INSULATION_PROPERTIES.get(insulation.material, (0.001, 2.5))
-    tan_delta = insulation.tan_delta or default_tan_delta
-    epsilon_r = insulation.permittivity or default_permittivity
-
-    # Calculate capacitance
-    epsilon_0 = 8.854e-12
-    d_c = insulation.conductor_diameter
-    d_i = insulation.conductor_diameter + 2 * insulation.thickness
-
-    capacitance = (2 * math.pi * epsilon_0 * epsilon_r) / math.log(d_i / d_c)
-    omega = 2 * math.pi * frequency
+    tan_delta = derived["tan_delta"]
+    epsilon_0 = derived["epsilon_0"]
+    epsilon_r = derived["epsilon_r"]
+    d_c = derived["d_c"]
+    d_i = derived["d_i"]
+    capacitance = derived["capacitance"]
+    omega = derived["omega"]
     u0 = voltage * 1000  # kV to V
+    material = _label_upper(insulation.material)
+    eps_0_sci = f"{epsilon_0:.3e}"
+    cap_numerator_sci = f"{_TWO_PI * epsilon_0 * epsilon_r:.3e}"
+    cap_sci = f"{capacitance:.3e}"
 
     section = f"""## 3.5 Dielectric Loss (IEC 60287-1-1:2023, Clause 5.3)
 
@@ -556,29 +747,29 @@ $$W_d = \\omega \\cdot C \\cdot U_0^2 \\cdot \\tan(\\delta)$$
 - $\\omega$ = Angular frequency = $2\\pi f$ = 2 × π × {frequency:.0f} = {omega:.2f} rad/s
 - $C$ = Capacitance per unit length (F/m)
 - $U_0$ = Phase-to-ground voltage = {voltage:.2f} kV = {u0:.0f} V
-- $\\tan(\\delta)$ = Insulation loss factor = {tan_delta} ({insulation.material.upper()})
+- $\\tan(\\delta)$ = Insulation loss factor = {tan_delta} ({material})
 
 **Capacitance Calculation:**
 
 $$C = \\frac{{2\\pi\\varepsilon_0\\varepsilon_r}}{{\\ln(D_i/d_c)}}$$
 
 **Where:**
-- $\\varepsilon_0$ = Permittivity of free space = {_format_scientific(epsilon_0)} F/m
-- $\\varepsilon_r$ = Relative permittivity = {epsilon_r} ({insulation.material.upper()})
+- $\\varepsilon_0$ = Permittivity of free space = {eps_0_sci} F/m
+- $\\varepsilon_r$ = Relative permittivity = {epsilon_r} ({material})
 - $d_c$ = Conductor diameter = {d_c:.2f} mm
 - $D_i$ = Diameter over insulation = {d_i:.2f} mm
 
 ```
-C = (2 × π × {_format_scientific(epsilon_0)} × {epsilon_r}) / ln({d_i:.2f} / {d_c:.2f})
-  = {_format_scientific(2 * math.pi * epsilon_0 * epsilon_r)} / ln({d_i/d_c:.4f})
-  = {_format_scientific(2 * math.pi * epsilon_0 * epsilon_r)} / {math.log(d_i/d_c):.4f}
-  = {_format_scientific(capacitance)} F/m
+C = (2 × π × {eps_0_sci} × {epsilon_r}) / ln({d_i:.2f} / {d_c:.2f})
+  = {cap_numerator_sci} / ln({d_i/d_c:.4f})
+  = {cap_numerator_sci} / {derived["ln_di_dc"]:.4f}
+  = {cap_sci} F/m
 ```
 
 **Dielectric Loss Calculation:**
 ```
-W_d = {omega:.2f} × {_format_scientific(capacitance)} × {u0:.0f}² × {tan_delta}
-    = {omega:.2f} × {_format_scientific(capacitance)} × {u0**2:.2e} × {tan_delta}
+W_d = {omega:.2f} × {cap_sci} × {u0:.0f}² × {tan_delta}
+    = {omega:.2f} × {cap_sci} × {u0 * u0:.2e} × {tan_delta}
     = {wd:.6f} W/m
 ```
 
@@ -592,9 +783,10 @@ def _generate_thermal_resistance_section(
     cable_spec: CableSpec,
     installation: Union[BurialConditions, ConduitConditions, DuctBankConditions],
     results: dict,
+    derived: Dict[str, Any],
 ) -> str:
     """Generate thermal resistance calculation section."""
-    geometry = cable_spec.geometry
+    geometry = derived["geometry"]
     thermal_r = results["thermal_resistance"]
 
     r1 = thermal_r["r1_insulation"]
@@ -607,9 +799,9 @@ def _generate_thermal_resistance_section(
 
     # Get thermal resistivities
     rho_ins = (cable_spec.insulation_thermal_resistivity
-               or THERMAL_RESISTIVITY.get(cable_spec.insulation.material, 3.5))
+               or _get_thermal_resistivity(cable_spec.insulation.material, 3.5))
     rho_jacket = (cable_spec.jacket_thermal_resistivity
-                  or THERMAL_RESISTIVITY.get(cable_spec.jacket_material, 3.5))
+                  or _get_thermal_resistivity(cable_spec.jacket_material, 3.5))
 
     # Cable diameters
     dc = geometry.conductor_diameter
@@ -620,7 +812,12 @@ def _generate_thermal_resistance_section(
     d_shield = geometry.shield_outer_diameter
     d_e = geometry.overall_diameter
 
-    section = f"""## 3.6 Thermal Resistances (IEC 60287-2-1:2023)
+    rho_ins_2pi = rho_ins * _INV_TWO_PI
+    t1_ratio = 2 * t1_total / dc
+    rho_jacket_2pi = rho_jacket * _INV_TWO_PI
+    de_ds_ratio = d_e / d_shield
+
+    parts = [f"""## 3.6 Thermal Resistances (IEC 60287-2-1:2023)
 
 ### T₁ - Insulation Thermal Resistance
 
@@ -639,9 +836,9 @@ $$T_1 = \\frac{{\\rho_T}}{{2\\pi}} \\times \\ln\\left(1 + \\frac{{2t_1}}{{d_c}}\
 **Calculation:**
 ```
 T₁ = ({rho_ins} / 2π) × ln(1 + 2 × {t1_total:.2f} / {dc:.2f})
-   = {rho_ins / (2 * math.pi):.4f} × ln(1 + {2 * t1_total / dc:.4f})
-   = {rho_ins / (2 * math.pi):.4f} × ln({1 + 2 * t1_total / dc:.4f})
-   = {rho_ins / (2 * math.pi):.4f} × {math.log(1 + 2 * t1_total / dc):.4f}
+   = {rho_ins_2pi:.4f} × ln(1 + {t1_ratio:.4f})
+   = {rho_ins_2pi:.4f} × ln({1 + t1_ratio:.4f})
+   = {rho_ins_2pi:.4f} × {math.log(1 + t1_ratio):.4f}
    = {r1:.4f} K·m/W
 ```
 
@@ -659,13 +856,16 @@ $$T_2 = \\frac{{\\rho_T}}{{2\\pi}} \\times \\ln\\left(\\frac{{D_e}}{{D_s}}\\righ
 **Calculation:**
 ```
 T₂ = ({rho_jacket} / 2π) × ln({d_e:.2f} / {d_shield:.2f})
-   = {rho_jacket / (2 * math.pi):.4f} × ln({d_e / d_shield:.4f})
-   = {rho_jacket / (2 * math.pi):.4f} × {math.log(d_e / d_shield):.4f}
+   = {rho_jacket_2pi:.4f} × ln({de_ds_ratio:.4f})
+   = {rho_jacket_2pi:.4f} × {math.log(de_ds_ratio):.4f}
    = {r2:.4f} K·m/W
-```"""
+```"""]
+
+    has_conduit = derived["has_conduit"]
+    has_concrete = derived["has_concrete"]
 
     # Add T3 if applicable (conduit/duct)
-    if r3 > 0:
+    if has_conduit:
         if isinstance(installation, ConduitConditions):
             duct_id = installation.conduit_id_mm
             duct_od = installation.conduit_od_mm
@@ -673,10 +873,10 @@ T₂ = ({rho_jacket} / 2π) × ln({d_e:.2f} / {d_shield:.2f})
             duct_id = installation.duct_id_mm
             duct_od = installation.duct_od_mm
 
-        rho_duct = CONDUIT_THERMAL_RESISTIVITY.get(
+        rho_duct = _get_conduit_thermal_resistivity(
             getattr(installation, 'conduit_material', getattr(installation, 'duct_material', 'pvc')), 6.0)
 
-        section += f"""
+        parts.append(f"""
 
 ### T₃ - Conduit/Duct Thermal Resistance
 
@@ -691,11 +891,11 @@ T₃ consists of two components:
 - Duct thermal resistivity: {rho_duct} K·m/W
 
 **Result:**
-- $T_3$ = **{r3:.4f} K·m/W**"""
+- $T_3$ = **{r3:.4f} K·m/W**""")
 
     # Add concrete resistance if applicable
-    if r_concrete > 0:
-        section += f"""
+    if has_concrete:
+        parts.append(f"""
 
 ### R_concrete - Concrete Encasement
 
@@ -703,15 +903,17 @@ For duct bank installations, the thermal resistance through the concrete encasem
 is calculated using the IEC geometric factor method.
 
 **Result:**
-- $R_{{concrete}}$ = **{r_concrete:.4f} K·m/W**"""
+- $R_{{concrete}}$ = **{r_concrete:.4f} K·m/W**""")
 
     # Add T4 - External thermal resistance
     if isinstance(installation, (BurialConditions, ConduitConditions)):
         L = installation.depth
     else:
         L = installation.depth + installation.bank_height / 2
+    L_mm = L * 1000
+    rho_soil = installation.soil_resistivity
 
-    section += f"""
+    parts.append(f"""
 
 ### T₄ - External (Earth) Thermal Resistance
 
@@ -720,14 +922,14 @@ is calculated using the IEC geometric factor method.
 $$T_4 = \\frac{{\\rho_{{soil}}}}{{2\\pi}} \\times \\ln\\left(\\frac{{4L}}{{D_e}}\\right)$$
 
 **Where:**
-- $\\rho_{{soil}}$ = Soil thermal resistivity = {installation.soil_resistivity} K·m/W
-- $L$ = Burial depth = {L:.3f} m = {L * 1000:.1f} mm
+- $\\rho_{{soil}}$ = Soil thermal resistivity = {rho_soil} K·m/W
+- $L$ = Burial depth = {L:.3f} m = {L_mm:.1f} mm
 - $D_e$ = External diameter = {d_e:.2f} mm
 
 **Calculation:**
 ```
-T₄ = ({installation.soil_resistivity} / 2π) × ln(4 × {L * 1000:.1f} / {d_e:.2f})
-   = {installation.soil_resistivity / (2 * math.pi):.4f} × ln({4 * L * 1000 / d_e:.4f})
+T₄ = ({rho_soil} / 2π) × ln(4 × {L_mm:.1f} / {d_e:.2f})
+   = {rho_soil * _INV_TWO_PI:.4f} × ln({4 * L_mm / d_e:.4f})
    = {r4:.4f} K·m/W
 ```
 
@@ -747,22 +949,22 @@ T₄_effective = T₄ × F_mutual
 | Component | Symbol | Value (K·m/W) |
 |-----------|--------|---------------|
 | Insulation | T₁ | {r1:.4f} |
-| Jacket | T₂ | {r2:.4f} |"""
+| Jacket | T₂ | {r2:.4f} |""")
 
-    if r3 > 0:
-        section += f"""
-| Conduit/Duct | T₃ | {r3:.4f} |"""
+    if has_conduit:
+        parts.append(f"""
+| Conduit/Duct | T₃ | {r3:.4f} |""")
 
-    if r_concrete > 0:
-        section += f"""
-| Concrete | R_conc | {r_concrete:.4f} |"""
+    if has_concrete:
+        parts.append(f"""
+| Concrete | R_conc | {r_concrete:.4f} |""")
 
-    section += f"""
+    parts.append(f"""
 | Earth | T₄ | {r4:.4f} |
 | Earth (effective) | T₄_eff | {r4_eff:.4f} |
-| **Total** | **ΣT** | **{thermal_r['total']:.4f}** |"""
+| **Total** | **ΣT** | **{thermal_r['total']:.4f}** |""")
 
-    return section
+    return "".join(parts)
 
 
 def _generate_shield_loss_section(
@@ -775,11 +977,11 @@ def _generate_shield_loss_section(
     section = f"""## 3.7 Shield Loss Factor (λ₁)
 
 **Shield Specifications:**
-- Material: {shield.material.capitalize()}
-- Type: {shield.type.capitalize()}
+- Material: {_label_capitalize(shield.material)}
+- Type: {_label_capitalize(shield.type)}
 - Thickness: {shield.thickness:.2f} mm
 - Mean diameter: {shield.mean_diameter:.2f} mm
-- Bonding: {shield.bonding.replace('_', ' ').title()}
+- Bonding: {_label_title(shield.bonding)}
 
 **For single-point bonding:**
 - No circulating currents flow in the shield
@@ -798,6 +1000,7 @@ def _generate_ampacity_section(
     results: dict,
     ambient_temp: float,
     max_temp: float,
+    derived: Dict[str, Any],
 ) -> str:
     """Generate ampacity calculation section."""
     delta_t_available = results["delta_t_available"]
@@ -814,13 +1017,17 @@ def _generate_ampacity_section(
     r_concrete = thermal_r.get("r_concrete", 0.0)
     r4_eff = thermal_r["r4_effective"]
 
-    r_total = r1 + r2 + r3 + r_concrete + r4_eff
-    r_conductor = (1 + lambda1) * r_total
-    r_dielectric = 0.5 * r1 + r2 + r3 + r_concrete + r4_eff
+    r_total = derived["r_total"]
+    r_dielectric = derived["r_dielectric"]
 
     ampacity = results["ampacity"]
     wd = results["losses"]["dielectric"]
 
+    delta_t_cond_avail = delta_t_available - delta_t_dielectric
+    shield_factor = 1 + lambda1
+    r_denominator = rac * shield_factor * r_total
+    rac_sci = derived["rac_sci"]
+
     section = f"""## 3.8 Ampacity Calculation
 
 **Standard Reference:** IEC 60287-1-1:2023, Clause 1.4
@@ -848,7 +1055,7 @@ $$\\Delta T_{{dielectric}} = W_d \\times (0.5 \\cdot T_1 + T_2 + T_3 + R_{{conc}
 ```
 ΔT_conductor = ΔT_available - ΔT_dielectric
              = {delta_t_available:.1f} - {delta_t_dielectric:.4f}
-             = {delta_t_available - delta_t_dielectric:.4f}°C
+             = {delta_t_cond_avail:.4f}°C
 ```
 
 ### Ampacity Formula
@@ -856,16 +1063,16 @@ $$\\Delta T_{{dielectric}} = W_d \\times (0.5 \\cdot T_1 + T_2 + T_3 + R_{{conc}
 $$I = \\sqrt{{\\frac{{\\Delta T_{{conductor}}}}{{R_{{AC}} \\times (1 + \\lambda_1) \\times (T_1 + T_2 + T_3 + R_{{conc}} + T_4)}}}}$$
 
 **Where:**
-- $\\Delta T_{{conductor}}$ = {delta_t_available - delta_t_dielectric:.4f}°C
-- $R_{{AC}}$ = {_format_scientific(rac)} Ω/m
-- $(1 + \\lambda_1)$ = {1 + lambda1:.6f}
+- $\\Delta T_{{conductor}}$ = {delta_t_cond_avail:.4f}°C
+- $R_{{AC}}$ = {rac_sci} Ω/m
+- $(1 + \\lambda_1)$ = {shield_factor:.6f}
 - $\\Sigma T$ = {r_total:.4f} K·m/W
 
 **Calculation:**
 ```
-I = √({delta_t_available - delta_t_dielectric:.4f} / ({_format_scientific(rac)} × {1 + lambda1:.6f} × {r_total:.4f}))
-  = √({delta_t_available - delta_t_dielectric:.4f} / {rac * (1 + lambda1) * r_total:.6e})
-  = √({(delta_t_available - delta_t_dielectric) / (rac * (1 + lambda1) * r_total):.2f})
+I = √({delta_t_cond_avail:.4f} / ({rac_sci} × {shield_factor:.6f} × {r_total:.4f}))
+  = √({delta_t_cond_avail:.4f} / {r_denominator:.6e})
+  = √({delta_t_cond_avail / r_denominator:.2f})
   = {ampacity:.1f} A
 ```
 
@@ -879,109 +1086,116 @@ I = √({delta_t_available - delta_t_dielectric:.4f} / ({_format_scientific(rac)
     return section
 
 
-def _generate_results_summary(results: dict, cable_spec: CableSpec) -> str:
-    """Generate results summary table."""
-    thermal_r = results["thermal_resistance"]
-
-    section = f"""## 4. Results Summary
-
-### Ampacity
-
-| Parameter | Symbol | Value | Unit |
-|-----------|--------|-------|------|
-| Ampacity (steady-state) | $I$ | **{results['ampacity']:.1f}** | A |
-| Ampacity (cyclic) | $I_{{cyclic}}$ | {results['ampacity_cyclic']:.1f} | A |
-
-### Resistance Values
-
-| Parameter | Symbol | Value | Unit |
-|-----------|--------|-------|------|
-| DC Resistance at max temp | $R_{{DC}}$ | {results['ac_resistance']['rdc'] * 1e6:.4f} | μΩ/m |
-| AC Resistance | $R_{{AC}}$ | {results['ac_resistance']['rac'] * 1e6:.4f} | μΩ/m |
-| AC/DC Ratio | $R_{{AC}}/R_{{DC}}$ | {results['ac_resistance']['rac'] / results['ac_resistance']['rdc']:.4f} | - |
-| Skin Effect Factor | $y_s$ | {results['ac_resistance']['ycs']:.4f} | - |
-| Proximity Effect Factor | $y_p$ | {results['ac_resistance']['ycp']:.4f} | - |
-
-### Losses at Rated Current
-
-| Parameter | Symbol | Value | Unit |
-|-----------|--------|-------|------|
-| Conductor Losses | $W_c$ | {results['losses']['conductor']:.2f} | W/m |
-| Dielectric Losses | $W_d$ | {results['losses']['dielectric']:.6f} | W/m |
-| Shield Losses | $W_s$ | {results['losses']['shield']:.4f} | W/m |
-| Total Losses | $W_{{total}}$ | {results['losses']['total']:.2f} | W/m |
-| Shield Loss Factor | $\\lambda_1$ | {results['shield_loss_factor']:.6f} | - |
-
-### Thermal Resistances
-
-| Parameter | Symbol | Value | Unit |
-|-----------|--------|-------|------|
-| Insulation | $T_1$ | {thermal_r['r1_insulation']:.4f} | K·m/W |
-| Jacket | $T_2$ | {thermal_r['r2_jacket']:.4f} | K·m/W |"""
-
-    if thermal_r.get('r3_conduit', 0) > 0:
-        section += f"""
-| Conduit/Duct | $T_3$ | {thermal_r['r3_conduit']:.4f} | K·m/W |"""
-
-    if thermal_r.get('r_concrete', 0) > 0:
-        section += f"""
-| Concrete | $R_{{conc}}$ | {thermal_r['r_concrete']:.4f} | K·m/W |"""
+_SUMMARY_TABLE_HEADER = (
+    "| Parameter | Symbol | Value | Unit |\n"
+    "|-----------|--------|-------|------|"
+)
+_SUMMARY_ROW = "| {} | {} | {} | {} |"
 
-    section += f"""
-| Earth | $T_4$ | {thermal_r['r4_earth']:.4f} | K·m/W |
-| Earth (effective) | $T_{{4,eff}}$ | {thermal_r['r4_effective']:.4f} | K·m/W |
-| Mutual Heating Factor | $F$ | {thermal_r['mutual_heating_factor']:.4f} | - |
-| **Total** | $\\Sigma T$ | **{thermal_r['total']:.4f}** | K·m/W |
 
-### Temperature Rise
+def _summary_table(title: str, rows: List[Tuple[str, str, str, str]]) -> str:
+    """Render one results summary table from (parameter, symbol, value, unit) rows."""
+    lines = [f"### {title}\n", _SUMMARY_TABLE_HEADER]
+    lines.extend(_SUMMARY_ROW.format(*row) for row in rows)
+    return "\n".join(lines)
 
-| Parameter | Symbol | Value | Unit |
-|-----------|--------|-------|------|
-| From Conductor Losses | $\\Delta T_c$ | {results['temperature_rise']['conductor_losses']:.2f} | °C |
-| From Dielectric Losses | $\\Delta T_d$ | {results['temperature_rise']['dielectric_losses']:.4f} | °C |
-| Total | $\\Delta T$ | {results['temperature_rise']['total']:.2f} | °C |
-| Ambient Temperature | $T_{{amb}}$ | {results['ambient_temp']:.1f} | °C |
-| Max Conductor Temperature | $T_{{max}}$ | {results['max_conductor_temp']:.0f} | °C |"""
 
-    return section
+def _generate_results_summary(results: dict, cable_spec: CableSpec, derived: Dict[str, Any]) -> str:
+    """Generate results summary table."""
+    thermal_r = results["thermal_resistance"]
+    ac = results["ac_resistance"]
+    losses = results["losses"]
+    temp_rise = results["temperature_rise"]
+
+    thermal_rows = [
+        ("Insulation", "$T_1$", f"{thermal_r['r1_insulation']:.4f}", "K·m/W"),
+        ("Jacket", "$T_2$", f"{thermal_r['r2_jacket']:.4f}", "K·m/W"),
+    ]
+    if derived["has_conduit"]:
+        thermal_rows.append(
+            ("Conduit/Duct", "$T_3$", f"{thermal_r['r3_conduit']:.4f}", "K·m/W"))
+    if derived["has_concrete"]:
+        thermal_rows.append(
+            ("Concrete", "$R_{conc}$", f"{thermal_r['r_concrete']:.4f}", "K·m/W"))
+    thermal_rows += [
+        ("Earth", "$T_4$", f"{thermal_r['r4_earth']:.4f}", "K·m/W"),
+        ("Earth (effective)", "$T_{4,eff}$", f"{thermal_r['r4_effective']:.4f}", "K·m/W"),
+        ("Mutual Heating Factor", "$F$", f"{thermal_r['mutual_heating_factor']:.4f}", "-"),
+        ("**Total**", "$\\Sigma T$", f"**{thermal_r['total']:.4f}**", "K·m/W"),
+    ]
+
+    tables = [
+        _summary_table("Ampacity", [
+            ("Ampacity (steady-state)", "$I$", f"**{results['ampacity']:.1f}**", "A"),
+            ("Ampacity (cyclic)", "$I_{cyclic}$", f"{results['ampacity_cyclic']:.1f}", "A"),
+        ]),
+        _summary_table("Resistance Values", [
+            ("DC Resistance at max temp", "$R_{DC}$", f"{derived['rdc_uohm']:.4f}", "μΩ/m"),
+            ("AC Resistance", "$R_{AC}$", f"{derived['rac_uohm']:.4f}", "μΩ/m"),
+            ("AC/DC Ratio", "$R_{AC}/R_{DC}$", f"{ac['rac'] / ac['rdc']:.4f}", "-"),
+            ("Skin Effect Factor", "$y_s$", f"{ac['ycs']:.4f}", "-"),
+            ("Proximity Effect Factor", "$y_p$", f"{ac['ycp']:.4f}", "-"),
+        ]),
+        _summary_table("Losses at Rated Current", [
+            ("Conductor Losses", "$W_c$", f"{losses['conductor']:.2f}", "W/m"),
+            ("Dielectric Losses", "$W_d$", f"{losses['dielectric']:.6f}", "W/m"),
+            ("Shield Losses", "$W_s$", f"{losses['shield']:.4f}", "W/m"),
+            ("Total Losses", "$W_{total}$", f"{losses['total']:.2f}", "W/m"),
+            ("Shield Loss Factor", "$\\lambda_1$", f"{results['shield_loss_factor']:.6f}", "-"),
+        ]),
+        _summary_table("Thermal Resistances", thermal_rows),
+        _summary_table("Temperature Rise", [
+            ("From Conductor Losses", "$\\Delta T_c$", f"{temp_rise['conductor_losses']:.2f}", "°C"),
+            ("From Dielectric Losses", "$\\Delta T_d$", f"{temp_rise['dielectric_losses']:.4f}", "°C"),
+            ("Total", "$\\Delta T$", f"{temp_rise['total']:.2f}", "°C"),
+            ("Ambient Temperature", "$T_{amb}$", f"{results['ambient_temp']:.1f}", "°C"),
+            ("Max Conductor Temperature", "$T_{max}$", f"{results['max_conductor_temp']:.0f}", "°C"),
+        ]),
+    ]
+
+    return "## 4. Results Summary\n\n" + "\n\n".join(tables)
+
+
+def _pct_diff(ours: float, theirs: float) -> float:
+    """Percent difference of our value relative to CYMCAP (0 if CYMCAP is 0)."""
+    return ((ours - theirs) / theirs * 100) if theirs else 0
 
 
 def _generate_cymcap_comparison(results: dict, cymcap_data: dict) -> str:
     """Generate CYMCAP comparison section."""
-    section = """## 5. Comparison with CYMCAP
-
-| Parameter | Our Value | CYMCAP | Difference |
-|-----------|-----------|--------|------------|"""
+    ac = results["ac_resistance"]
 
-    our_amp = results["ampacity"]
     cymcap_amp = cymcap_data.get("ampacity_A", 0)
     if isinstance(cymcap_amp, list):
         cymcap_amp = max(cymcap_amp)
-    amp_diff = ((our_amp - cymcap_amp) / cymcap_amp * 100) if cymcap_amp else 0
+    our_amp = results["ampacity"]
 
-    section += f"""
-| Ampacity (A) | {our_amp:.1f} | {cymcap_amp} | {amp_diff:+.2f}% |"""
+    rows = [
+        """## 5. Comparison with CYMCAP
+
+| Parameter | Our Value | CYMCAP | Difference |
+|-----------|-----------|--------|------------|""",
+        _SUMMARY_ROW.format(
+            "Ampacity (A)", f"{our_amp:.1f}", cymcap_amp, f"{_pct_diff(our_amp, cymcap_amp):+.2f}%"),
+    ]
 
-    our_ys = results["ac_resistance"]["ycs"]
     cymcap_ys = cymcap_data.get("ys", [])
     if cymcap_ys:
         cymcap_ys_avg = sum(cymcap_ys) / len(cymcap_ys)
-        ys_diff = ((our_ys - cymcap_ys_avg) / cymcap_ys_avg * 100) if cymcap_ys_avg else 0
-        section += f"""
-| Skin Effect (ys) | {our_ys:.4f} | {cymcap_ys_avg:.4f} | {ys_diff:+.2f}% |"""
+        rows.append(_SUMMARY_ROW.format(
+            "Skin Effect (ys)", f"{ac['ycs']:.4f}", f"{cymcap_ys_avg:.4f}",
+            f"{_pct_diff(ac['ycs'], cymcap_ys_avg):+.2f}%"))
 
-    our_yp = results["ac_resistance"]["ycp"]
     cymcap_yp = cymcap_data.get("yp", [])
     if cymcap_yp:
         cymcap_yp_avg = sum(cymcap_yp) / len(cymcap_yp)
-        section += f"""
-| Proximity Effect (yp) | {our_yp:.4f} | {cymcap_yp_avg:.4f} | - |"""
+        rows.append(_SUMMARY_ROW.format(
+            "Proximity Effect (yp)", f"{ac['ycp']:.4f}", f"{cymcap_yp_avg:.4f}", "-"))
 
     cymcap_t1 = cymcap_data.get("T1_Km_per_W")
     if cymcap_t1:
         our_t1 = results["thermal_resistance"]["r1_insulation"]
-        t1_diff = ((our_t1 - cymcap_t1) / cymcap_t1 * 100) if cymcap_t1 else 0
-        section += f"""
-| T1 (K·m/W) | {our_t1:.4f} | {cymcap_t1:.4f} | {t1_diff:+.2f}% |"""
+        rows.append(_SUMMARY_ROW.format(
+            "T1 (K·m/W)", f"{our_t1:.4f}", f"{cymcap_t1:.4f}", f"{_pct_diff(our_t1, cymcap_t1):+.2f}%"))
 
-    return section
+    return "\n".join(rows)
@@ -5,15 +5,26 @@ Main solver that calculates cable ampacity using iterative method.
 Based on Neher-McGrath (1957) and IEC 60287 standards.
 """
 
+import collections.abc
 import math
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Literal, Optional, Union
-
-from .ac_resistance import ConductorSpec, calculate_ac_resistance
+from itertools import repeat
+from typing import List, Literal, Optional, Sequence, Tuple, Union
+
+from .ac_resistance import (
+    ConductorSpec,
+    TEMPERATURE_COEFFICIENT,
+    SKIN_EFFECT_CONSTANT,
+    PROXIMITY_EFFECT_CONSTANT,
+    calculate_ac_resistance,
+)
 from .losses import (
     InsulationSpec,
     ShieldSpec,
+    EPSILON_0,
     calculate_dielectric_loss,
+    get_dielectric_properties,
     calculate_shield_loss_factor,
     MAX_CONDUCTOR_TEMP,
 )
@@ -28,7 +39,7 @@ from .thermal_resistance import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class CableSpec:
     """Complete cable specification for ampacity calculation.
 
@@ -69,7 +80,7 @@ class CableSpec:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class OperatingConditions:
     """Operating conditions for ampacity calculation."""
     voltage: float                # Phase-to-ground voltage (kV)
@@ -81,6 +92,168 @@ class OperatingConditions:
 # Type alias for installation conditions
 InstallationConditions = Union[BurialConditions, ConduitConditions, DuctBankConditions]
 
+# Installation type -> (result label, thermal resistance function, spacing
+# attribute in m). Order matters for the isinstance fallback.
+_INSTALLATION_HANDLERS = {
+    DuctBankConditions: ("duct_bank", calculate_ductbank_thermal_resistances, "duct_spacing_h"),
+    ConduitConditions: ("conduit", calculate_conduit_thermal_resistances, "spacing"),
+    BurialConditions: ("direct_buried", calculate_thermal_resistances, "spacing"),
+}
+
+
+def _iterate_current(
+    conductor: ConductorSpec,
+    shield: Optional[ShieldSpec],
+    spacing: float,
+    frequency: float,
+    ambient_temp: float,
+    r_thermal: float,
+    delta_t_dielectric: float,
+    delta_t_conductor: float,
+    current: float,
+    rac: float,
+    lambda1: float,
+    r_conductor: float,
+    tolerance: float,
+    max_iterations: int,
+) -> Tuple[float, float, float, int]:
+    """
+    Fixed-point iteration on the conductor current.
+
+    Works on plain floats only (the thermal resistances are passed as their
+    sum R1 + R2 + R3 + R_concrete + R4), so the numeric loop is independent
+    of the result dictionaries assembled by calculate_ampacity().
+
+    Args:
+        conductor: Conductor specification
+        shield: Shield specification (None if unshielded)
+        spacing: Axial spacing between conductors in mm
+        frequency: System frequency in Hz
+        ambient_temp: Ambient temperature in °C
+        r_thermal: Sum of thermal resistances in K.m/W
+        delta_t_dielectric: Temperature rise from dielectric losses in °C
+        delta_t_conductor: Temperature rise available for conductor losses in °C
+        current: Initial current estimate in A
+        rac: AC resistance at the initial estimate in ohm/m
+        lambda1: Initial shield loss factor
+        r_conductor: Initial (1+λ1)·ΣR in K.m/W
+        tolerance: Convergence tolerance for ampacity (A)
+        max_iterations: Maximum iterations
+
+    Returns:
+        (current, lambda1, r_conductor, iterations)
+    """
+    iterations = 1
+    for iteration in range(max_iterations):
+        iterations = iteration + 1
+
+        # Calculate losses at current estimate
+        wc = current * current * rac
+
+        # Calculate actual temperature rise
+        delta_t_calc = wc * r_conductor + delta_t_dielectric
+        t_conductor = ambient_temp + delta_t_calc
+
+        # Recalculate AC resistance at actual temperature
+        _, _, _, new_rac = calculate_ac_resistance(
+            conductor,
+            temperature=t_conductor,
+            spacing=spacing,
+            frequency=frequency,
+        )
+
+        # Recalculate shield loss factor
+        if shield is not None:
+            lambda1 = calculate_shield_loss_factor(
+                shield,
+                new_rac,
+                spacing,
+                frequency,
+            )
+            r_conductor = (1 + lambda1) * r_thermal
+
+        # New current estimate
+        new_current = math.sqrt(delta_t_conductor / (new_rac * r_conductor))
+
+        # Check convergence
+        if abs(new_current - current) < tolerance:
+            return new_current, lambda1, r_conductor, iterations
+
+        current = new_current
+        rac = new_rac
+
+    # Did not converge; return the last estimate
+    return current, lambda1, r_conductor, iterations
+
+
+def calculate_intermediate_values(
+    cable: CableSpec,
+    operating: OperatingConditions,
+    results: dict,
+) -> dict:
+    """
+    Calculate the intermediate quantities behind a calculate_ampacity() result.
+
+    These are the values the QA/QC report shows in its step-by-step
+    derivations. They are not needed to solve for the ampacity, so they are
+    only calculated when asked for rather than on every solve.
+
+    Args:
+        cable: Cable specification
+        operating: Operating conditions
+        results: Results dictionary from calculate_ampacity()
+
+    Returns:
+        Dictionary of intermediate values
+    """
+    conductor = cable.conductor
+    insulation = cable.insulation
+    frequency = operating.frequency
+    conductor_temp = results["max_conductor_temp"]
+    rdc = results["ac_resistance"]["rdc"]
+
+    # DC resistance at 20°C (reverse of the temperature correction)
+    alpha = TEMPERATURE_COEFFICIENT[conductor.material]
+    rdc_20 = rdc / (1 + alpha * (conductor_temp - 20))
+
+    # Skin and proximity effect arguments share the 8πf/R_DC term
+    ks = conductor.ks if conductor.ks is not None else SKIN_EFFECT_CONSTANT.get(conductor.stranding, 1.0)
+    kp = conductor.kp if conductor.kp is not None else PROXIMITY_EFFECT_CONSTANT.get(conductor.stranding, 1.0)
+    x_base = 8 * math.pi * frequency / rdc
+    xs_squared = x_base * 1e-7 * ks
+    xp_squared = x_base * 1e-7 * kp
+
+    # Insulation capacitance C = 2πε₀εᵣ / ln(D_i / d_c)
+    _, epsilon_r = get_dielectric_properties(insulation)
+    d_c = insulation.conductor_diameter
+    d_i = insulation.conductor_diameter + 2 * insulation.thickness
+    ln_di_dc = math.log(d_i / d_c)
+    capacitance = (2 * math.pi * EPSILON_0 * epsilon_r) / ln_di_dc
+
+    # Thermal resistance sums, as used by the solver
+    thermal_r = results["thermal_resistance"]
+    r1 = thermal_r["r1_insulation"]
+    r2 = thermal_r["r2_jacket"]
+    r3 = thermal_r.get("r3_conduit", 0.0)
+    r_concrete = thermal_r.get("r_concrete", 0.0)
+    r4 = thermal_r["r4_effective"]
+
+    return {
+        "rdc_20": rdc_20,
+        "ks": ks,
+        "kp": kp,
+        "x_base": x_base,
+        "xs_squared": xs_squared,
+        "xs": math.sqrt(xs_squared),
+        "xp_squared": xp_squared,
+        "xp": math.sqrt(xp_squared),
+        "ln_di_dc": ln_di_dc,
+        "capacitance": capacitance,
+        "omega": 2 * math.pi * frequency,
+        "r_total": r1 + r2 + r3 + r_concrete + r4,
+        "r_dielectric": 0.5 * r1 + r2 + r3 + r_concrete + r4,
+    }
+
 
 def calculate_ampacity(
     cable: CableSpec,
@@ -113,6 +286,52 @@ def calculate_ampacity(
     Returns:
         Dictionary with ampacity and detailed breakdown
     """
+    thermal = _installation_thermal_resistances(cable, installation)
+    return _solve_ampacity(cable, installation, operating, thermal, tolerance, max_iterations)
+
+
+def _installation_thermal_resistances(
+    cable: CableSpec,
+    installation: InstallationConditions,
+) -> Tuple[str, dict, float]:
+    """
+    Calculate the thermal resistances for an installation.
+
+    These depend only on the cable and installation, not on operating
+    conditions, so batch runs can reuse them across scenarios.
+
+    Returns:
+        (installation_type, thermal resistance dict, conductor spacing in mm)
+    """
+    handler = _INSTALLATION_HANDLERS.get(type(installation))
+    if handler is None:
+        # Subclasses (and anything else, treated as direct burial)
+        handler = next(
+            (h for cls, h in _INSTALLATION_HANDLERS.items() if isinstance(installation, cls)),
+            _INSTALLATION_HANDLERS[BurialConditions],
+        )
+    installation_type, calculate, spacing_attr = handler
+
+    thermal_r = calculate(cable.geometry, installation)
+    spacing = getattr(installation, spacing_attr) * 1000  # m to mm for resistance calc
+
+    return installation_type, thermal_r, spacing
+
+
+def _solve_ampacity(
+    cable: CableSpec,
+    installation: InstallationConditions,
+    operating: OperatingConditions,
+    thermal: Tuple[str, dict, float],
+    tolerance: float,
+    max_iterations: int,
+) -> dict:
+    """Solve for ampacity given precomputed installation thermal resistances."""
+    conductor = cable.conductor
+    shield = cable.shield
+    frequency = operating.frequency
+    ambient_temp = installation.ambient_temp
+
     # Maximum conductor temperature
     if operating.max_conductor_temp is not None:
         tc_max = operating.max_conductor_temp
@@ -120,45 +339,34 @@ def calculate_ampacity(
         tc_max = MAX_CONDUCTOR_TEMP[cable.insulation.material]
 
     # Temperature difference available
-    delta_t_available = tc_max - installation.ambient_temp
-
-    # Determine installation type and calculate thermal resistances
-    geometry = cable.geometry
-
-    if isinstance(installation, DuctBankConditions):
-        installation_type = "duct_bank"
-        thermal_r = calculate_ductbank_thermal_resistances(geometry, installation)
-        spacing = installation.duct_spacing_h * 1000  # m to mm for resistance calc
-    elif isinstance(installation, ConduitConditions):
-        installation_type = "conduit"
-        thermal_r = calculate_conduit_thermal_resistances(geometry, installation)
-        spacing = installation.spacing * 1000  # m to mm
-    else:
-        installation_type = "direct_buried"
-        thermal_r = calculate_thermal_resistances(geometry, installation)
-        spacing = installation.spacing * 1000  # m to mm
+    delta_t_available = tc_max - ambient_temp
+
+    # Installation type and thermal resistances
+    installation_type, thermal_r, spacing = thermal
 
     # Calculate dielectric losses (constant, independent of current)
     wd = calculate_dielectric_loss(
         cable.insulation,
         operating.voltage,
-        operating.frequency,
+        frequency,
+    )
+
+    # AC resistance at maximum conductor temperature; used for the initial
+    # shield loss factor, the initial current estimate and the final results
+    r_ac_init = calculate_ac_resistance(
+        conductor,
+        temperature=tc_max,
+        spacing=spacing,
+        frequency=frequency,
     )
 
     # Calculate shield loss factor (approximate, will be refined)
-    if cable.shield is not None:
-        # Initial estimate using approximate conductor resistance
-        r_init = calculate_ac_resistance(
-            cable.conductor,
-            temperature=tc_max,
-            spacing=spacing,
-            frequency=operating.frequency,
-        )
+    if shield is not None:
         lambda1 = calculate_shield_loss_factor(
-            cable.shield,
-            r_init["rac"],
+            shield,
+            r_ac_init.rac,
             spacing,
-            operating.frequency,
+            frequency,
         )
     else:
         lambda1 = 0.0
@@ -173,7 +381,8 @@ def calculate_ampacity(
     r_concrete = thermal_r.get("r_concrete", 0.0)
 
     # For conductor losses: R_total = (1+λ1)×(R1 + R2 + R3 + R_concrete + R4)
-    r_conductor = (1 + lambda1) * (r1 + r2 + r3 + r_concrete + r4)
+    r_thermal = r1 + r2 + r3 + r_concrete + r4
+    r_conductor = (1 + lambda1) * r_thermal
 
     # For dielectric losses: R_dielectric = 0.5×R1 + R2 + R3 + R_concrete + R4
     r_dielectric = 0.5 * r1 + r2 + r3 + r_concrete + r4
@@ -192,66 +401,32 @@ def calculate_ampacity(
 
     # Initial ampacity estimate
     # I² = ΔT_conductor / (Rac × R_conductor)
-    r_ac_init = calculate_ac_resistance(
-        cable.conductor,
-        temperature=tc_max,
-        spacing=spacing,
-        frequency=operating.frequency,
-    )
-    i_estimate = math.sqrt(delta_t_conductor / (r_ac_init["rac"] * r_conductor))
+    i_estimate = math.sqrt(delta_t_conductor / (r_ac_init.rac * r_conductor))
 
     # Iterative refinement
-    current = i_estimate
-    for iteration in range(max_iterations):
-        # Calculate losses at current estimate
-        wc = current ** 2 * r_ac_init["rac"]
-
-        # Calculate actual temperature rise
-        delta_t_calc = wc * r_conductor + delta_t_dielectric
-        t_conductor = installation.ambient_temp + delta_t_calc
-
-        # Recalculate AC resistance at actual temperature
-        r_ac = calculate_ac_resistance(
-            cable.conductor,
-            temperature=t_conductor,
-            spacing=spacing,
-            frequency=operating.frequency,
-        )
-
-        # Recalculate shield loss factor
-        if cable.shield is not None:
-            lambda1 = calculate_shield_loss_factor(
-                cable.shield,
-                r_ac["rac"],
-                spacing,
-                operating.frequency,
-            )
-            r_conductor = (1 + lambda1) * (r1 + r2 + r3 + r_concrete + r4)
-
-        # New current estimate
-        new_current = math.sqrt(delta_t_conductor / (r_ac["rac"] * r_conductor))
-
-        # Check convergence
-        if abs(new_current - current) < tolerance:
-            current = new_current
-            break
-
-        current = new_current
-        r_ac_init = r_ac
-    else:
-        # Did not converge
-        pass
-
-    # Final calculations at converged current
-    r_ac_final = calculate_ac_resistance(
-        cable.conductor,
-        temperature=tc_max,
+    current, lambda1, r_conductor, iterations = _iterate_current(
+        conductor=conductor,
+        shield=shield,
         spacing=spacing,
-        frequency=operating.frequency,
+        frequency=frequency,
+        ambient_temp=ambient_temp,
+        r_thermal=r_thermal,
+        delta_t_dielectric=delta_t_dielectric,
+        delta_t_conductor=delta_t_conductor,
+        current=i_estimate,
+        rac=r_ac_init.rac,
+        lambda1=lambda1,
+        r_conductor=r_conductor,
+        tolerance=tolerance,
+        max_iterations=max_iterations,
     )
 
-    wc = current ** 2 * r_ac_final["rac"]
+    # Final calculations at converged current (rated at tc_max)
+    r_ac_final = r_ac_init
+
+    wc = current * current * r_ac_final.rac
     ws = lambda1 * wc
+    delta_t_conductor_losses = wc * r_conductor
 
     # Apply load factor if specified
     if operating.load_factor < 1.0:
@@ -267,13 +442,13 @@ def calculate_ampacity(
         "ampacity_cyclic": current_cyclic,
         "installation_type": installation_type,
         "max_conductor_temp": tc_max,
-        "ambient_temp": installation.ambient_temp,
+        "ambient_temp": ambient_temp,
         "delta_t_available": delta_t_available,
         "ac_resistance": {
-            "rdc": r_ac_final["rdc"],
-            "rac": r_ac_final["rac"],
-            "ycs": r_ac_final["ycs"],
-            "ycp": r_ac_final["ycp"],
+            "rdc": r_ac_final.rdc,
+            "rac": r_ac_final.rac,
+            "ycs": r_ac_final.ycs,
+            "ycp": r_ac_final.ycp,
         },
         "losses": {
             "conductor": wc,
@@ -292,12 +467,12 @@ def calculate_ampacity(
             "total": thermal_r["total"],
         },
         "temperature_rise": {
-            "conductor_losses": wc * r_conductor,
+            "conductor_losses": delta_t_conductor_losses,
             "dielectric_losses": delta_t_dielectric,
-            "total": wc * r_conductor + delta_t_dielectric,
+            "total": delta_t_conductor_losses + delta_t_dielectric,
         },
         "shield_loss_factor": lambda1,
-        "iterations": iteration + 1 if 'iteration' in dir() else 1,
+        "iterations": iterations,
     }
 
     # Add duct bank specific info
@@ -310,73 +485,152 @@ def calculate_ampacity(
     return result
 
 
+def calculate_ampacity_batch(
+    cables: Union[CableSpec, Sequence[CableSpec]],
+    installations: Union[InstallationConditions, Sequence[InstallationConditions]],
+    operatings: Union[OperatingConditions, Sequence[OperatingConditions]],
+    tolerance: float = 0.01,
+    max_iterations: int = 100,
+    max_workers: Optional[int] = None,
+) -> List[dict]:
+    """
+    Calculate ampacity for a batch of scenarios (parametric sweeps).
+
+    Each argument is either a single spec shared by every scenario or a
+    sequence with one entry per scenario, so a sweep over e.g. burial depth
+    only needs the varying installations listed. All sequences must have
+    the same length. Thermal resistances are calculated once per distinct
+    (cable, installation) pair.
+
+    Scenarios are independent, so with max_workers > 1 they are solved in
+    a process pool instead (each worker then calculates its own thermal
+    resistances); results are returned in scenario order either way.
+
+    Args:
+        cables: Cable specification(s)
+        installations: Installation condition(s)
+        operatings: Operating condition(s)
+        tolerance: Convergence tolerance for ampacity (A)
+        max_iterations: Maximum iterations
+        max_workers: Number of worker processes (None or 1 solves serially)
+
+    Returns:
+        List of result dictionaries, one per scenario, as from calculate_ampacity()
+    """
+    args = (cables, installations, operatings)
+    lengths = {len(arg) for arg in args if isinstance(arg, collections.abc.Sequence)}
+    if len(lengths) > 1:
+        raise ValueError("cables, installations and operatings must be single specs or sequences of equal length")
+    n = lengths.pop() if lengths else 1
+
+    cable_list, installation_list, operating_list = [
+        arg if isinstance(arg, collections.abc.Sequence) else [arg] * n
+        for arg in args
+    ]
+
+    if max_workers is not None and max_workers > 1 and n > 1:
+        chunksize = max(1, n // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(
+                calculate_ampacity,
+                cable_list,
+                installation_list,
+                operating_list,
+                repeat(tolerance),
+                repeat(max_iterations),
+                chunksize=chunksize,
+            ))
+
+    # Thermal resistances depend only on the cable and installation, so
+    # scenarios that share both (e.g. operating-condition sweeps) reuse them
+    thermal_cache = {}
+    results = []
+    for cable, installation, operating in zip(cable_list, installation_list, operating_list):
+        key = (id(cable), id(installation))
+        thermal = thermal_cache.get(key)
+        if thermal is None:
+            thermal = thermal_cache[key] = _installation_thermal_resistances(cable, installation)
+        results.append(_solve_ampacity(cable, installation, operating, thermal, tolerance, max_iterations))
+
+    return results
+
+
+# Display labels and rules used by format_results
+_INSTALLATION_LABELS = {
+    "direct_buried": "Direct Buried",
+    "conduit": "Conduit",
+    "duct_bank": "Duct Bank",
+}
+_RULE = "=" * 60
+_SUBRULE = "-" * 40
+
+
 def format_results(results: dict) -> str:
     """Format ampacity results for display."""
     installation_type = results.get("installation_type", "direct_buried")
-    installation_labels = {
-        "direct_buried": "Direct Buried",
-        "conduit": "Conduit",
-        "duct_bank": "Duct Bank",
-    }
+    ac = results['ac_resistance']
+    losses = results['losses']
+    thermal_r = results['thermal_resistance']
+    temp_rise = results['temperature_rise']
 
     lines = [
-        "=" * 60,
+        _RULE,
         "CABLE AMPACITY CALCULATION RESULTS",
-        "=" * 60,
+        _RULE,
         "",
-        f"Installation Type:       {installation_labels.get(installation_type, installation_type)}",
+        f"Installation Type:       {_INSTALLATION_LABELS.get(installation_type, installation_type)}",
         f"Ampacity (steady-state): {results['ampacity']:.1f} A",
         f"Ampacity (cyclic):       {results['ampacity_cyclic']:.1f} A",
         "",
         "TEMPERATURES",
-        "-" * 40,
+        _SUBRULE,
         f"  Max conductor temp:    {results['max_conductor_temp']:.1f} °C",
         f"  Ambient temp:          {results['ambient_temp']:.1f} °C",
         f"  Available ΔT:          {results['delta_t_available']:.1f} °C",
         "",
         "AC RESISTANCE",
-        "-" * 40,
-        f"  DC resistance:         {results['ac_resistance']['rdc']*1000:.4f} mΩ/m",
-        f"  AC resistance:         {results['ac_resistance']['rac']*1000:.4f} mΩ/m",
-        f"  Skin effect (Ycs):     {results['ac_resistance']['ycs']:.4f}",
-        f"  Proximity effect (Ycp):{results['ac_resistance']['ycp']:.4f}",
+        _SUBRULE,
+        f"  DC resistance:         {ac['rdc']*1000:.4f} mΩ/m",
+        f"  AC resistance:         {ac['rac']*1000:.4f} mΩ/m",
+        f"  Skin effect (Ycs):     {ac['ycs']:.4f}",
+        f"  Proximity effect (Ycp):{ac['ycp']:.4f}",
         "",
         "LOSSES (at rated current)",
-        "-" * 40,
-        f"  Conductor losses:      {results['losses']['conductor']:.2f} W/m",
-        f"  Dielectric losses:     {results['losses']['dielectric']:.4f} W/m",
-        f"  Shield losses:         {results['losses']['shield']:.2f} W/m",
-        f"  Total losses:          {results['losses']['total']:.2f} W/m",
+        _SUBRULE,
+        f"  Conductor losses:      {losses['conductor']:.2f} W/m",
+        f"  Dielectric losses:     {losses['dielectric']:.4f} W/m",
+        f"  Shield losses:         {losses['shield']:.2f} W/m",
+        f"  Total losses:          {losses['total']:.2f} W/m",
         f"  Shield loss factor:    {results['shield_loss_factor']:.4f}",
         "",
         "THERMAL RESISTANCES",
-        "-" * 40,
-        f"  R1 (insulation):       {results['thermal_resistance']['r1_insulation']:.4f} K·m/W",
-        f"  R2 (jacket):           {results['thermal_resistance']['r2_jacket']:.4f} K·m/W",
+        _SUBRULE,
+        f"  R1 (insulation):       {thermal_r['r1_insulation']:.4f} K·m/W",
+        f"  R2 (jacket):           {thermal_r['r2_jacket']:.4f} K·m/W",
     ]
 
     # Add R3 (conduit) if applicable
-    r3 = results['thermal_resistance'].get('r3_conduit', 0)
+    r3 = thermal_r.get('r3_conduit', 0)
     if r3 > 0:
         lines.append(f"  R3 (conduit):          {r3:.4f} K·m/W")
 
     # Add R_concrete if applicable
-    r_concrete = results['thermal_resistance'].get('r_concrete', 0)
+    r_concrete = thermal_r.get('r_concrete', 0)
     if r_concrete > 0:
         lines.append(f"  R (concrete):          {r_concrete:.4f} K·m/W")
 
     lines.extend([
-        f"  R4 (earth):            {results['thermal_resistance']['r4_earth']:.4f} K·m/W",
-        f"  Mutual heating factor: {results['thermal_resistance']['mutual_heating_factor']:.3f}",
-        f"  R4 (effective):        {results['thermal_resistance']['r4_effective']:.4f} K·m/W",
-        f"  Total:                 {results['thermal_resistance']['total']:.4f} K·m/W",
+        f"  R4 (earth):            {thermal_r['r4_earth']:.4f} K·m/W",
+        f"  Mutual heating factor: {thermal_r['mutual_heating_factor']:.3f}",
+        f"  R4 (effective):        {thermal_r['r4_effective']:.4f} K·m/W",
+        f"  Total:                 {thermal_r['total']:.4f} K·m/W",
         "",
         "TEMPERATURE RISE",
-        "-" * 40,
-        f"  From conductor losses: {results['temperature_rise']['conductor_losses']:.2f} °C",
-        f"  From dielectric losses:{results['temperature_rise']['dielectric_losses']:.2f} °C",
-        f"  Total:                 {results['temperature_rise']['total']:.2f} °C",
+        _SUBRULE,
+        f"  From conductor losses: {temp_rise['conductor_losses']:.2f} °C",
+        f"  From dielectric losses:{temp_rise['dielectric_losses']:.2f} °C",
+        f"  Total:                 {temp_rise['total']:.2f} °C",
         "",
-        "=" * 60,
+        _RULE,
     ])
     return "\n".join(lines)
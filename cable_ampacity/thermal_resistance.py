@@ -9,9 +9,14 @@ Calculates thermal resistances:
 Based on IEC 60287-2-1 and Neher-McGrath method.
 """
 
+import collections.abc
 import math
-from dataclasses import dataclass
-from typing import Literal, Optional
+import operator
+import warnings
+from dataclasses import dataclass, field
+from typing import List, Literal, Optional, Sequence, Union
+
+from .losses import LossResult
 
 
 # Thermal resistivities (K·m/W)
@@ -52,8 +57,15 @@ CONDUIT_THERMAL_RESISTIVITY = {
 # Concrete thermal resistivity (K·m/W) - typical range 0.8-1.2
 CONCRETE_THERMAL_RESISTIVITY = 1.0
 
+_INV_TWO_PI = 1.0 / (2 * math.pi)
+
+# ρ/2π per material, the coefficient of the ln(D_outer/D_inner) layer formula
+_THERMAL_RESISTIVITY_OVER_2PI = {k: v * _INV_TWO_PI for k, v in THERMAL_RESISTIVITY.items()}
+_CONDUIT_THERMAL_RESISTIVITY_OVER_2PI = {k: v * _INV_TWO_PI for k, v in CONDUIT_THERMAL_RESISTIVITY.items()}
+_DEFAULT_CONDUIT_RESISTIVITY_OVER_2PI = 6.0 * _INV_TWO_PI
+
 
-@dataclass
+@dataclass(slots=True)
 class BackfillLayer:
     """Specification for a backfill/soil layer in the installation.
 
@@ -83,7 +95,7 @@ class BackfillLayer:
         return self.x_center + self.width / 2
 
 
-@dataclass
+@dataclass(slots=True)
 class CablePosition:
     """Position of a single cable in the installation.
 
@@ -96,7 +108,7 @@ class CablePosition:
     cable_id: Optional[str] = None  # Optional cable identifier
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CableGeometry:
     """Cable geometry for thermal calculations.
 
@@ -107,6 +119,8 @@ class CableGeometry:
     - Insulation screen (insulation_screen_thickness) - semiconducting
     - Metallic shield/sheath (shield_thickness)
     - Jacket (jacket_thickness)
+
+    Instances are immutable; the layer diameters are computed once on creation.
     """
     conductor_diameter: float     # mm
     insulation_thickness: float   # mm
@@ -120,34 +134,26 @@ class CableGeometry:
     # Optional thermal resistivity overrides
     insulation_thermal_resistivity: Optional[float] = None  # K.m/W (override default)
     jacket_thermal_resistivity: Optional[float] = None      # K.m/W (override default)
-
-    @property
-    def conductor_shield_outer_diameter(self) -> float:
-        """Diameter over conductor shield (mm)."""
-        return self.conductor_diameter + 2 * self.conductor_shield_thickness
-
-    @property
-    def insulation_outer_diameter(self) -> float:
-        """Diameter over insulation (mm)."""
-        return self.conductor_shield_outer_diameter + 2 * self.insulation_thickness
-
-    @property
-    def insulation_screen_outer_diameter(self) -> float:
-        """Diameter over insulation screen (mm)."""
-        return self.insulation_outer_diameter + 2 * self.insulation_screen_thickness
-
-    @property
-    def shield_outer_diameter(self) -> float:
-        """Diameter over metallic shield (mm)."""
-        return self.insulation_screen_outer_diameter + 2 * self.shield_thickness
-
-    @property
-    def overall_diameter(self) -> float:
-        """Overall cable diameter (mm)."""
-        return self.shield_outer_diameter + 2 * self.jacket_thickness
-
-
-@dataclass
+    # Derived layer diameters (mm), set in __post_init__
+    conductor_shield_outer_diameter: float = field(init=False, repr=False, compare=False)
+    insulation_outer_diameter: float = field(init=False, repr=False, compare=False)
+    insulation_screen_outer_diameter: float = field(init=False, repr=False, compare=False)
+    shield_outer_diameter: float = field(init=False, repr=False, compare=False)
+    overall_diameter: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        d = self.conductor_diameter + 2 * self.conductor_shield_thickness
+        object.__setattr__(self, "conductor_shield_outer_diameter", d)
+        d = d + 2 * self.insulation_thickness
+        object.__setattr__(self, "insulation_outer_diameter", d)
+        d = d + 2 * self.insulation_screen_thickness
+        object.__setattr__(self, "insulation_screen_outer_diameter", d)
+        d = d + 2 * self.shield_thickness
+        object.__setattr__(self, "shield_outer_diameter", d)
+        object.__setattr__(self, "overall_diameter", d + 2 * self.jacket_thickness)
+
+
+@dataclass(slots=True)
 class BurialConditions:
     """Direct burial installation conditions."""
     depth: float                  # Burial depth to cable center (m)
@@ -158,7 +164,7 @@ class BurialConditions:
     circuit_spacing: float = 0.0  # Spacing between circuits (m)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConduitConditions:
     """Conduit installation conditions (cable in conduit in soil)."""
     depth: float                  # Burial depth to conduit center (m)
@@ -172,7 +178,7 @@ class ConduitConditions:
     num_conduits: int = 1         # Number of conduits
 
 
-@dataclass
+@dataclass(slots=True)
 class DuctBankConditions:
     """Concrete duct bank installation conditions.
 
@@ -199,6 +205,35 @@ class DuctBankConditions:
     conduit_thermal_resistivity: Optional[float] = None  # Override default for duct material
 
 
+def _neher_mcgrath_log(L: float, D: float, clamp: bool = False) -> float:
+    """
+    Return the Neher-McGrath geometric term for a body of diameter D at depth L.
+
+    ln(4L/D) for deep burial (u = 2L/D > 10), otherwise the full formula
+    ln(u + √(u² - 1)) = acosh(u). u below 1 means the burial depth is less
+    than the radius of the buried body, which is an input error rather than a
+    valid geometry: a ValueError is raised, or with clamp=True (duct-bank
+    paths) a warning is emitted and the term is clamped to zero.
+    """
+    if L > 5 * D:
+        # Simplified formula for deep burial
+        return math.log(4 * L / D)
+    u = 2 * L / D
+    if u < 1.0:
+        if not clamp:
+            raise ValueError(
+                f"Burial depth is less than the radius (u = 2L/D = {u:.3f})"
+            )
+        warnings.warn(
+            f"Burial depth is less than the radius (u = 2L/D = {u:.3f}); "
+            "external thermal resistance clamped to zero",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        return 0.0
+    return math.acosh(u)
+
+
 def calculate_insulation_thermal_resistance(
     geometry: CableGeometry,
 ) -> float:
@@ -217,16 +252,16 @@ def calculate_insulation_thermal_resistance(
         Thermal resistance R1 in K·m/W
     """
     # Use user-specified thermal resistivity if provided
-    rho_t = (geometry.insulation_thermal_resistivity
-             if geometry.insulation_thermal_resistivity is not None
-             else THERMAL_RESISTIVITY[geometry.insulation_material])
+    k_t = (geometry.insulation_thermal_resistivity * _INV_TWO_PI
+           if geometry.insulation_thermal_resistivity is not None
+           else _THERMAL_RESISTIVITY_OVER_2PI[geometry.insulation_material])
 
     # Inner diameter: conductor or conductor shield outer diameter
     d_c = geometry.conductor_diameter  # mm
     # Outer diameter: over insulation (includes conductor shield in the thermal path)
     d_i = geometry.insulation_outer_diameter  # mm
 
-    r1 = (rho_t / (2 * math.pi)) * math.log(d_i / d_c)
+    r1 = k_t * math.log(d_i / d_c)
 
     return r1
 
@@ -251,14 +286,14 @@ def calculate_jacket_thermal_resistance(
         return 0.0
 
     # Use user-specified thermal resistivity if provided
-    rho_t = (geometry.jacket_thermal_resistivity
-             if geometry.jacket_thermal_resistivity is not None
-             else THERMAL_RESISTIVITY[geometry.jacket_material])
+    k_t = (geometry.jacket_thermal_resistivity * _INV_TWO_PI
+           if geometry.jacket_thermal_resistivity is not None
+           else _THERMAL_RESISTIVITY_OVER_2PI[geometry.jacket_material])
 
     d_s = geometry.shield_outer_diameter  # mm
     d_e = geometry.overall_diameter  # mm
 
-    r2 = (rho_t / (2 * math.pi)) * math.log(d_e / d_s)
+    r2 = k_t * math.log(d_e / d_s)
 
     return r2
 
@@ -287,14 +322,10 @@ def calculate_earth_thermal_resistance(
     L = burial.depth * 1000  # Convert m to mm
     D_e = geometry.overall_diameter  # mm
 
+    k_soil = rho_soil * _INV_TWO_PI
+
     # Neher-McGrath formula
-    u = 2 * L / D_e
-    if u > 10:
-        # Simplified formula for deep burial
-        r4 = (rho_soil / (2 * math.pi)) * math.log(4 * L / D_e)
-    else:
-        # Full formula
-        r4 = (rho_soil / (2 * math.pi)) * math.log(u + math.sqrt(u ** 2 - 1))
+    r4 = k_soil * _neher_mcgrath_log(L, D_e)
 
     return r4
 
@@ -316,8 +347,12 @@ def find_layer_at_position(
         BackfillLayer containing the position, or None if not found
     """
     for layer in layers:
-        if (layer.x_left <= x <= layer.x_right and
-            layer.y_top <= y <= layer.y_bottom):
+        # Bounds inlined (x_left/x_right/y_bottom) to avoid property calls per layer
+        y_top = layer.y_top
+        if not y_top <= y <= y_top + layer.height:
+            continue
+        half_width = layer.width / 2
+        if layer.x_center - half_width <= x <= layer.x_center + half_width:
             return layer
     return None
 
@@ -449,11 +484,7 @@ def calculate_multilayer_earth_resistance(
         # Simple case - uniform soil
         D_e = cable_diameter  # mm
         L = cable_y * 1000  # Convert m to mm
-        u = 2 * L / D_e
-        if u > 10:
-            r4 = (native_soil_resistivity / (2 * math.pi)) * math.log(4 * L / D_e)
-        else:
-            r4 = (native_soil_resistivity / (2 * math.pi)) * math.log(u + math.sqrt(max(u ** 2 - 1, 0.01)))
+        r4 = native_soil_resistivity * _INV_TWO_PI * _neher_mcgrath_log(L, D_e, clamp=True)
         return r4, {"native_soil": r4}
 
     # Sort layers by y_top (depth from surface)
@@ -495,7 +526,7 @@ def calculate_multilayer_earth_resistance(
 
         # Simplified contribution based on layer thickness and resistivity
         # R_layer ≈ (ρ / 2π) × thickness / (geometric_mean_radius)
-        r_contribution = (layer.thermal_resistivity / (2 * math.pi)) * (thickness / cable_y)
+        r_contribution = layer.thermal_resistivity * _INV_TWO_PI * (thickness / cable_y)
 
         total_r4 += r_contribution
         details[layer.name] = r_contribution
@@ -506,32 +537,40 @@ def calculate_multilayer_earth_resistance(
 
     if uppermost_y > 0:
         # Native soil from surface to uppermost backfill layer
-        native_contribution = (native_soil_resistivity / (2 * math.pi)) * (uppermost_y / cable_y)
+        native_contribution = native_soil_resistivity * _INV_TWO_PI * (uppermost_y / cable_y)
         total_r4 += native_contribution
         details["native_soil_above"] = native_contribution
 
-    # Base earth thermal resistance using effective approach
-    eff_rho = calculate_effective_soil_resistivity(cable_x, cable_y, layers, native_soil_resistivity)
-    L = cable_y * 1000  # mm
-    u = 2 * L / D_e / 1000  # Dimensionless
-    if u > 10:
-        r4_base = (eff_rho / (2 * math.pi)) * math.log(4 * L / (D_e * 1000))
-    else:
-        r4_base = (eff_rho / (2 * math.pi)) * math.log(u + math.sqrt(max(u ** 2 - 1, 0.01)))
-
     # Use the more accurate of the two approaches
     # (layered calculation or effective resistivity)
     if total_r4 > 0 and len(details) > 1:
         # Multi-layer case - use layered result
         return total_r4, details
-    else:
-        # Simple case - use effective resistivity
-        return r4_base, {"effective": r4_base}
+
+    # Simple case - base earth thermal resistance using effective resistivity
+    eff_rho = calculate_effective_soil_resistivity(cable_x, cable_y, layers, native_soil_resistivity)
+    L = cable_y * 1000  # mm
+    r4_base = eff_rho * _INV_TWO_PI * _neher_mcgrath_log(L, D_e * 1000, clamp=True)
+    return r4_base, {"effective": r4_base}
+
+
+def _image_log_ratio(d_pk: float, image_offset: float) -> float:
+    """
+    Return ln(d'_pk / d_pk) for a cable at horizontal distance d_pk.
+
+    The image lies image_offset (2L) deeper, so d'_pk = √(d_pk² + (2L)²)
+    and d'_pk / d_pk - 1 = (2L)² / (d_pk × (d'_pk + d_pk)). Using log1p on
+    that avoids cancellation when the ratio is close to 1 (wide spacing,
+    shallow burial).
+    """
+    d_pk_image = math.hypot(d_pk, image_offset)
+    return math.log1p(image_offset * image_offset / (d_pk * (d_pk_image + d_pk)))
 
 
 def calculate_mutual_heating_factor(
     geometry: CableGeometry,
     burial: BurialConditions,
+    r4: Optional[float] = None,
 ) -> float:
     """
     Calculate mutual heating factor for multiple cables.
@@ -545,6 +584,7 @@ def calculate_mutual_heating_factor(
     Args:
         geometry: Cable geometry
         burial: Burial conditions
+        r4: Earth thermal resistance (K·m/W), if already calculated
 
     Returns:
         Mutual heating factor (≥1.0)
@@ -560,15 +600,16 @@ def calculate_mutual_heating_factor(
     # Distance to adjacent cable
     d_pk = s
 
-    # Distance to image of adjacent cable (reflection about ground surface)
-    d_pk_image = math.sqrt(s ** 2 + (2 * L) ** 2)
-
     # Mutual heating contribution per adjacent cable
-    delta_r4 = (rho_soil / (2 * math.pi)) * math.log(d_pk_image / d_pk)
+    delta_r4 = rho_soil * _INV_TWO_PI * _image_log_ratio(d_pk, 2 * L)
 
     # For trefoil, 2 adjacent cables
     # The mutual heating increases the effective thermal resistance
-    factor = 1 + 2 * delta_r4 / calculate_earth_thermal_resistance(geometry, burial)
+    if r4 is None:
+        r4 = calculate_earth_thermal_resistance(geometry, burial)
+    if r4 <= 0:
+        return 1.0
+    factor = 1 + 2 * delta_r4 / r4
 
     return max(1.0, factor)
 
@@ -603,7 +644,7 @@ def calculate_cable_mutual_heating(
 
     x_t = target_cable.x
     y_t = target_cable.y
-    rho = soil_resistivity
+    k_soil = soil_resistivity * _INV_TWO_PI
 
     total_mutual = 0.0
 
@@ -614,27 +655,70 @@ def calculate_cable_mutual_heating(
             cable.phase == target_cable.phase):
             continue
 
-        x_k = cable.x
-        y_k = cable.y
+        dx2 = (x_t - cable.x) ** 2
 
-        # Distance to other cable
-        d_pk = math.sqrt((x_t - x_k) ** 2 + (y_t - y_k) ** 2)
+        # Squared distance to other cable
+        d2_pk = dx2 + (y_t - cable.y) ** 2
 
-        if d_pk < 0.001:  # Essentially same position
+        if d2_pk < 1e-6:  # Essentially same position (d_pk < 1 mm)
             continue
 
-        # Distance to image of other cable (reflected about ground surface)
-        d_pk_image = math.sqrt((x_t - x_k) ** 2 + (y_t + y_k) ** 2)
+        # Squared distance to image of other cable (reflected about ground surface)
+        d2_pk_image = dx2 + (y_t + cable.y) ** 2
 
         # Mutual heating contribution
-        # Using image method: ΔR = (ρ / 2π) × ln(d'_pk / d_pk)
-        if d_pk_image > d_pk:
-            delta_r = (rho / (2 * math.pi)) * math.log(d_pk_image / d_pk)
+        # Using image method: ΔR = (ρ / 2π) × ln(d'_pk / d_pk) = (ρ / 2π) × ½ln(d'_pk² / d_pk²)
+        if d2_pk_image > d2_pk:
+            delta_r = k_soil * 0.5 * math.log(d2_pk_image / d2_pk)
             total_mutual += delta_r
 
     return total_mutual
 
 
+def calculate_all_mutual_heating(
+    cables: list,
+    soil_resistivity: float,
+) -> List[float]:
+    """
+    Calculate mutual heating at every cable from all other cables.
+
+    Equivalent to calling calculate_cable_mutual_heating() for each cable in
+    turn, but the image-method term is symmetric in the cable pair, so each
+    pair is evaluated once instead of twice.
+
+    Args:
+        cables: List of CablePosition objects
+        soil_resistivity: Soil thermal resistivity (K.m/W)
+
+    Returns:
+        Additional thermal resistance due to mutual heating (K.m/W), one per cable
+    """
+    n_cables = len(cables)
+    k_soil = soil_resistivity * _INV_TWO_PI
+    coupling = [[0.0] * n_cables for _ in range(n_cables)]
+
+    # Cable coordinates (m), read once instead of per pair
+    xs = [cable.x for cable in cables]
+    ys = [cable.y for cable in cables]
+
+    for i in range(n_cables):
+        x_i, y_i = xs[i], ys[i]
+        for j in range(i + 1, n_cables):
+            x_j, y_j = xs[j], ys[j]
+            dx2 = (x_i - x_j) ** 2
+
+            # Squared distances avoid the square roots: ln(d'/d) = ½ln(d'²/d²)
+            d2_pk = dx2 + (y_i - y_j) ** 2
+            if d2_pk < 1e-6:  # Same position (d_pk < 1 mm)
+                continue
+
+            d2_pk_image = dx2 + (y_i + y_j) ** 2
+            if d2_pk_image > d2_pk:
+                coupling[i][j] = coupling[j][i] = k_soil * 0.5 * math.log(d2_pk_image / d2_pk)
+
+    return [sum(row) for row in coupling]
+
+
 def calculate_iterative_mutual_heating(
     cable_positions: list,
     geometry_od_mm: float,
@@ -683,14 +767,18 @@ def calculate_iterative_mutual_heating(
     if n_cables == 0:
         return []
 
+    # Cable coordinates (m), read once instead of per pair
+    xs = [cp.x for cp in cable_positions]
+    ys = [cp.y for cp in cable_positions]
+
     # Use effective soil resistivity if backfill layers are defined
     # This accounts for high-resistivity layers like gravel beds and surface aggregate
     # For mutual heating, we need to consider all layers from cable to surface
     if duct_bank.backfill_layers:
         # Calculate average effective resistivity based on cable positions
         # Using for_mutual_heating=True to consider all layers to surface
-        avg_x = sum(cp.x for cp in cable_positions) / n_cables
-        avg_y = sum(cp.y for cp in cable_positions) / n_cables
+        avg_x = sum(xs) / n_cables
+        avg_y = sum(ys) / n_cables
         rho = calculate_effective_soil_resistivity(
             avg_x, avg_y, duct_bank.backfill_layers, duct_bank.soil_resistivity,
             for_mutual_heating=True
@@ -705,94 +793,101 @@ def calculate_iterative_mutual_heating(
     if delta_t_conductor <= 0:
         return [{"cable_position": cp, "ampacity": 0.0} for cp in cable_positions]
 
+    # Loop invariants: loss factor and internal resistances are the same for every cable
+    loss_factor = 1 + lambda1
+    r_internal = r1 + r2 + r3
+
     # Pre-calculate coupling factors F_ij = (ρ/2π) × ln(d'_ij / d_ij)
     # This represents the thermal resistance coupling between cables
     # Uses effective soil resistivity to account for layered backfill
+    # F_ij is symmetric, so each pair is evaluated once and mirrored
+    k_soil = rho * _INV_TWO_PI
     coupling_factors = [[0.0] * n_cables for _ in range(n_cables)]
 
     for i in range(n_cables):
-        for j in range(n_cables):
-            if i == j:
-                continue
-            xi, yi = cable_positions[i].x, cable_positions[i].y
-            xj, yj = cable_positions[j].x, cable_positions[j].y
+        xi, yi = xs[i], ys[i]
+        for j in range(i + 1, n_cables):
+            xj, yj = xs[j], ys[j]
+            dx2 = (xi - xj) ** 2
 
-            # Distance to cable j
-            d_ij = math.sqrt((xi - xj) ** 2 + (yi - yj) ** 2)
+            # Squared distance to cable j
+            d2_ij = dx2 + (yi - yj) ** 2
 
-            # Distance to image of cable j (reflected about ground surface)
-            d_ij_image = math.sqrt((xi - xj) ** 2 + (yi + yj) ** 2)
+            # Squared distance to image of cable j (reflected about ground surface)
+            d2_ij_image = dx2 + (yi + yj) ** 2
 
-            if d_ij > 0.001 and d_ij_image > d_ij:
-                coupling_factors[i][j] = (rho / (2 * math.pi)) * math.log(d_ij_image / d_ij)
+            # ln(d'_ij / d_ij) = ½ln(d'_ij² / d_ij²), skipping cables closer than 1 mm
+            if d2_ij > 1e-6 and d2_ij_image > d2_ij:
+                coupling_factors[i][j] = coupling_factors[j][i] = k_soil * 0.5 * math.log(d2_ij_image / d2_ij)
 
     # Calculate R4 for each cable position
-    r4_values = []
-    for cable in cable_positions:
-        if duct_bank.backfill_layers:
-            r4, _ = calculate_multilayer_earth_resistance(
-                cable.x, cable.y,
-                geometry_od_mm,
-                duct_bank.backfill_layers,
-                duct_bank.soil_resistivity,
-            )
-        else:
-            L = cable.y * 1000  # mm
-            D_e = duct_bank.duct_od_mm
-            u = 2 * L / D_e
-            if u > 10:
-                r4 = (rho / (2 * math.pi)) * math.log(4 * L / D_e)
-            else:
-                r4 = (rho / (2 * math.pi)) * math.log(u + math.sqrt(max(u ** 2 - 1, 0.01)))
-        r4_values.append(r4)
+    if duct_bank.backfill_layers:
+        # Layers are passed in user order: find_layer_at_position returns the
+        # first match, which decides overlapping layers in the fallback path
+        layers = duct_bank.backfill_layers
+        r4_values = [
+            calculate_multilayer_earth_resistance(
+                x, y, geometry_od_mm, layers, duct_bank.soil_resistivity,
+            )[0]
+            for x, y in zip(xs, ys)
+        ]
+    else:
+        D_e = duct_bank.duct_od_mm
+        r4_values = [k_soil * _neher_mcgrath_log(y * 1000, D_e, clamp=True) for y in ys]
 
     # Initialize with equal currents (no weighting)
     # First pass: calculate base ampacity without current weighting
     ampacities = []
+    r_mutual = [sum(row) for row in coupling_factors]
     for i in range(n_cables):
-        r_mutual_unweighted = sum(coupling_factors[i])
-        r4_total = r4_values[i] + r_mutual_unweighted
-        r_conductor = (1 + lambda1) * (r1 + r2 + r3 + r4_total)
-        if r_conductor > 0 and delta_t_conductor > 0:
+        r4_total = r4_values[i] + r_mutual[i]
+        r_conductor = loss_factor * (r_internal + r4_total)
+        if r_conductor > 0:
             amp = math.sqrt(delta_t_conductor / (conductor_rac * r_conductor))
         else:
             amp = 0.0
         ampacities.append(amp)
 
     # Iterative refinement with current-weighted mutual heating
+    # (r_mutual keeps the mutual resistances behind the latest ampacities)
+    # Buffers are allocated once and overwritten on every iteration
+    heat_factor = conductor_rac * loss_factor
+    heat_weights = [0.0] * n_cables
+    new_ampacities = [0.0] * n_cables
+    iterations = 0
     for iteration in range(max_iterations):
+        iterations = iteration + 1
         # Calculate heat output for each cable based on current ampacity
         # Q_i = I_i² × Rac × (1 + λ1)
-        heat_outputs = [(amp ** 2 * conductor_rac * (1 + lambda1)) for amp in ampacities]
-        total_heat = sum(heat_outputs)
+        for i, amp in enumerate(ampacities):
+            heat_weights[i] = amp * amp * heat_factor
+        total_heat = sum(heat_weights)
         if total_heat <= 0:
             break
 
-        # Normalize heat outputs to weights
-        heat_weights = [q / (total_heat / n_cables) if total_heat > 0 else 1.0 for q in heat_outputs]
+        # Normalize heat outputs to weights (mean weight = 1)
+        weight_scale = n_cables / total_heat
+        for i in range(n_cables):
+            heat_weights[i] *= weight_scale
 
-        new_ampacities = []
         for i in range(n_cables):
             # Calculate weighted mutual heating
             # Cables with higher heat output contribute more to mutual heating
-            r_mutual_weighted = 0.0
-            for j in range(n_cables):
-                if i != j:
-                    # Weight by relative heat output of cable j
-                    r_mutual_weighted += coupling_factors[i][j] * heat_weights[j]
+            # (F_ii = 0, so the row product needs no self check)
+            r_mutual[i] = sum(map(operator.mul, coupling_factors[i], heat_weights))
 
-            r4_total = r4_values[i] + r_mutual_weighted
-            r_conductor = (1 + lambda1) * (r1 + r2 + r3 + r4_total)
+            r4_total = r4_values[i] + r_mutual[i]
+            r_conductor = loss_factor * (r_internal + r4_total)
 
-            if r_conductor > 0 and delta_t_conductor > 0:
+            if r_conductor > 0:
                 amp = math.sqrt(delta_t_conductor / (conductor_rac * r_conductor))
             else:
                 amp = 0.0
-            new_ampacities.append(amp)
+            new_ampacities[i] = amp
 
-        # Check convergence
+        # Check convergence, then swap buffers
         max_diff = max(abs(new_ampacities[i] - ampacities[i]) for i in range(n_cables))
-        ampacities = new_ampacities
+        ampacities, new_ampacities = new_ampacities, ampacities
 
         if max_diff < tolerance:
             break
@@ -800,9 +895,6 @@ def calculate_iterative_mutual_heating(
     # Build results
     results = []
     for i in range(n_cables):
-        # Final mutual heating calculation
-        r_mutual = sum(coupling_factors[i][j] * heat_weights[j] for j in range(n_cables) if i != j)
-
         results.append({
             "cable_position": cable_positions[i],
             "ampacity": ampacities[i],
@@ -810,11 +902,11 @@ def calculate_iterative_mutual_heating(
             "r2": r2,
             "r3": r3,
             "r4": r4_values[i],
-            "r_mutual": r_mutual,
-            "r4_total": r4_values[i] + r_mutual,
+            "r_mutual": r_mutual[i],
+            "r4_total": r4_values[i] + r_mutual[i],
             "delta_t_conductor": delta_t_conductor,
             "delta_t_dielectric": delta_t_dielectric,
-            "iterations": iteration + 1,
+            "iterations": iterations,
         })
 
     return results
@@ -866,7 +958,7 @@ def calculate_per_cable_ampacity(
     duct_rho = (duct_bank.conduit_thermal_resistivity
                 if duct_bank.conduit_thermal_resistivity
                 else CONDUIT_THERMAL_RESISTIVITY.get(duct_bank.duct_material, 6.0))
-    r3_wall = (duct_rho / (2 * math.pi)) * math.log(
+    r3_wall = duct_rho * _INV_TWO_PI * math.log(
         duct_bank.duct_od_mm / duct_bank.duct_id_mm
     )
     r3 = r3_air + r3_wall
@@ -891,44 +983,38 @@ def calculate_per_cable_ampacity(
     results = []
     delta_t_available = max_temp - ambient_temp
     delta_t_dielectric = dielectric_loss * (0.5 * r1 + r2 + r3)
+    # Temperature rise for conductor (excluding dielectric), same for every cable
+    delta_t_conductor = delta_t_available - delta_t_dielectric
+    loss_factor = 1 + lambda1
+    r_internal = r1 + r2 + r3
+    k_soil = duct_bank.soil_resistivity * _INV_TWO_PI
+    mutual_values = calculate_all_mutual_heating(cable_positions, duct_bank.soil_resistivity)
 
-    for cable in cable_positions:
-        # Calculate earth thermal resistance for this position
-        if duct_bank.backfill_layers:
-            r4, layer_details = calculate_multilayer_earth_resistance(
+    # Earth thermal resistance for every position, as (r4, layer_details) pairs
+    if duct_bank.backfill_layers:
+        earth_values = [
+            calculate_multilayer_earth_resistance(
                 cable.x, cable.y,
                 geometry.overall_diameter,
                 duct_bank.backfill_layers,
                 duct_bank.soil_resistivity,
             )
-        else:
-            # Simple earth resistance
-            L = cable.y * 1000  # mm
-            D_e = duct_bank.duct_od_mm
-            u = 2 * L / D_e
-            if u > 10:
-                r4 = (duct_bank.soil_resistivity / (2 * math.pi)) * math.log(4 * L / D_e)
-            else:
-                r4 = (duct_bank.soil_resistivity / (2 * math.pi)) * math.log(
-                    u + math.sqrt(max(u ** 2 - 1, 0.01))
-                )
-            layer_details = {"soil": r4}
-
-        # Calculate mutual heating from other cables (simple method)
-        r_mutual = calculate_cable_mutual_heating(
-            cable, cable_positions,
-            duct_bank.soil_resistivity,
-            0,  # Current not needed for resistance calculation
-        )
-
+            for cable in cable_positions
+        ]
+    else:
+        # Simple earth resistance
+        D_e = duct_bank.duct_od_mm
+        earth_values = []
+        for cable in cable_positions:
+            r4 = k_soil * _neher_mcgrath_log(cable.y * 1000, D_e, clamp=True)
+            earth_values.append((r4, {"soil": r4}))
+
+    for cable, (r4, layer_details), r_mutual in zip(cable_positions, earth_values, mutual_values):
         # Total external resistance with mutual heating
         r4_total = r4 + r_mutual
 
-        # Temperature rise for conductor (excluding dielectric)
-        delta_t_conductor = delta_t_available - delta_t_dielectric
-
         # Thermal resistance for conductor heat
-        r_conductor = (1 + lambda1) * (r1 + r2 + r3 + r4_total)
+        r_conductor = loss_factor * (r_internal + r4_total)
 
         # Calculate ampacity
         if r_conductor > 0 and delta_t_conductor > 0:
@@ -976,23 +1062,124 @@ def calculate_thermal_resistances(
     r1 = calculate_insulation_thermal_resistance(geometry)
     r2 = calculate_jacket_thermal_resistance(geometry)
     r4 = calculate_earth_thermal_resistance(geometry, burial)
-    f_mutual = calculate_mutual_heating_factor(geometry, burial)
+    f_mutual = calculate_mutual_heating_factor(geometry, burial, r4)
 
-    r4_effective = r4 * f_mutual
-    total = r1 + r2 + r4_effective
+    return _direct_buried_resistances(r1, r2, r4, f_mutual)
 
+
+def _direct_buried_resistances(r1: float, r2: float, r4: float, f_mutual: float) -> dict:
+    """Assemble the calculate_thermal_resistances() dictionary from its parts."""
+    r4_effective = r4 * f_mutual
     return {
         "r1": r1,
         "r2": r2,
         "r4": r4,
         "f_mutual": f_mutual,
         "r4_effective": r4_effective,
-        "total": total,
+        "total": r1 + r2 + r4_effective,
     }
 
 
+def calculate_thermal_resistances_batch(
+    geometries: Union[CableGeometry, Sequence[CableGeometry]],
+    burials: Union[BurialConditions, Sequence[BurialConditions]],
+) -> List[dict]:
+    """
+    Calculate thermal resistances for a batch of direct buried scenarios.
+
+    Intended for parameter sweeps (depth, soil resistivity, spacing, ...).
+    Each argument is either a single spec shared by every scenario or a
+    sequence with one entry per scenario; sequences must have the same
+    length. R1 and R2 depend only on the cable geometry, so they are
+    calculated once per distinct geometry instead of once per scenario.
+
+    Args:
+        geometries: Cable geometry (or geometries)
+        burials: Burial condition(s)
+
+    Returns:
+        List of dictionaries, one per scenario, as from calculate_thermal_resistances()
+    """
+    args = (geometries, burials)
+    lengths = {len(arg) for arg in args if isinstance(arg, collections.abc.Sequence)}
+    if len(lengths) > 1:
+        raise ValueError("geometries and burials must be single specs or sequences of equal length")
+    n = lengths.pop() if lengths else 1
+
+    geometry_list, burial_list = [
+        arg if isinstance(arg, collections.abc.Sequence) else [arg] * n
+        for arg in args
+    ]
+
+    cable_cache = {}
+    results = []
+    for geometry, burial in zip(geometry_list, burial_list):
+        cable_r = cable_cache.get(id(geometry))
+        if cable_r is None:
+            cable_r = cable_cache[id(geometry)] = (
+                calculate_insulation_thermal_resistance(geometry),
+                calculate_jacket_thermal_resistance(geometry),
+            )
+        r1, r2 = cable_r
+        r4 = calculate_earth_thermal_resistance(geometry, burial)
+        f_mutual = calculate_mutual_heating_factor(geometry, burial, r4)
+        results.append(_direct_buried_resistances(r1, r2, r4, f_mutual))
+
+    return results
+
+
+def calculate_thermal_resistances_grid(
+    geometry: CableGeometry,
+    depths: Sequence[float],
+    soil_resistivities: Sequence[float],
+    spacing: float = 0.0,
+    num_circuits: int = 1,
+) -> List[List[dict]]:
+    """
+    Calculate direct buried thermal resistances over a depth × soil resistivity grid.
+
+    Intended for contour-plot style sweeps. R4 and the mutual heating term
+    are ρ_soil/2π times a logarithm that depends only on depth, so each
+    logarithm is evaluated once per depth rather than once per grid cell.
+    Each cell matches calculate_thermal_resistances() for a BurialConditions
+    with that depth and soil resistivity.
+
+    Args:
+        geometry: Cable geometry
+        depths: Burial depths to cable center (m)
+        soil_resistivities: Soil thermal resistivities (K·m/W)
+        spacing: Axial spacing between phases (m), 0 for single cable
+        num_circuits: Number of parallel circuits
+
+    Returns:
+        Nested list indexed [depth][soil_resistivity] of dictionaries as
+        from calculate_thermal_resistances()
+    """
+    r1 = calculate_insulation_thermal_resistance(geometry)
+    r2 = calculate_jacket_thermal_resistance(geometry)
+    D_e = geometry.overall_diameter  # mm
+    mutual = spacing != 0 and num_circuits > 1
+    k_soils = [rho_soil * _INV_TWO_PI for rho_soil in soil_resistivities]
+
+    grid = []
+    for depth in depths:
+        L = depth * 1000  # Convert m to mm
+        ln_r4 = _neher_mcgrath_log(L, D_e)
+        # ln(d'_pk / d_pk) for the adjacent trefoil cable
+        ln_mutual = _image_log_ratio(spacing, 2 * depth) if mutual else 0.0
+
+        row = []
+        for k_soil in k_soils:
+            r4 = k_soil * ln_r4
+            f_mutual = max(1.0, 1 + 2 * (k_soil * ln_mutual) / r4) if mutual and r4 > 0 else 1.0
+            row.append(_direct_buried_resistances(r1, r2, r4, f_mutual))
+        grid.append(row)
+
+    return grid
+
+
 def calculate_temperature_rise(
-    losses: dict,
+    losses: Union[LossResult, dict],
     thermal_resistances: dict,
     lambda1: float = 0.0,
 ) -> dict:
@@ -1006,15 +1193,17 @@ def calculate_temperature_rise(
     ΔT = Wc×[(1+λ1)×R1 + (1+λ1)×R2 + (1+λ1)×R4] + Wd×[0.5×R1 + R2 + R4]
 
     Args:
-        losses: Dictionary with wc, wd, ws values (W/m)
+        losses: LossResult from calculate_losses(), or a dict with wc, wd values (W/m)
         thermal_resistances: Dictionary with r1, r2, r4_effective values (K·m/W)
         lambda1: Shield loss factor
 
     Returns:
         Dictionary with temperature rise breakdown (°C)
     """
-    wc = losses["wc"]
-    wd = losses["wd"]
+    if isinstance(losses, LossResult):
+        wc, wd = losses.wc, losses.wd
+    else:
+        wc, wd = losses["wc"], losses["wd"]
     r1 = thermal_resistances["r1"]
     r2 = thermal_resistances["r2"]
     r4 = thermal_resistances["r4_effective"]
@@ -1061,12 +1250,6 @@ def calculate_conduit_air_gap_resistance(
     Returns:
         Air gap thermal resistance (K·m/W)
     """
-    D_cable = cable_diameter_mm / 1000  # Convert to m
-    D_conduit = conduit_id_mm / 1000    # Convert to m
-
-    # Fill factor (ratio of cable area to conduit area)
-    fill_factor = (D_cable / D_conduit) ** 2
-
     # IEC 60287-2-1 coefficients for air gap
     # These depend on whether cable is in free air or touching conduit
     # Using simplified correlation for single cable in conduit
@@ -1079,12 +1262,12 @@ def calculate_conduit_air_gap_resistance(
     # Mean temperature rise above ambient
     theta_m = mean_temperature - 20.0  # Reference 20°C
 
-    # Convection/radiation coefficient
-    h = 1 + 0.1 * (V + Y * theta_m) * D_conduit * 1000  # D in mm for formula
+    # Convection/radiation coefficient (diameters in mm for the formula)
+    h = 1 + 0.1 * (V + Y * theta_m) * conduit_id_mm
 
     # Air gap thermal resistance
     # For single cable not touching conduit wall
-    T4_prime = U / (math.pi * D_cable * 1000 * h)
+    T4_prime = U / (math.pi * cable_diameter_mm * h)
 
     return T4_prime
 
@@ -1107,9 +1290,9 @@ def calculate_conduit_wall_resistance(
     Returns:
         Conduit wall thermal resistance (K·m/W)
     """
-    rho = CONDUIT_THERMAL_RESISTIVITY.get(conduit_material, 6.0)
+    k = _CONDUIT_THERMAL_RESISTIVITY_OVER_2PI.get(conduit_material, _DEFAULT_CONDUIT_RESISTIVITY_OVER_2PI)
 
-    r_conduit = (rho / (2 * math.pi)) * math.log(conduit_od_mm / conduit_id_mm)
+    r_conduit = k * math.log(conduit_od_mm / conduit_id_mm)
 
     return r_conduit
 
@@ -1146,25 +1329,20 @@ def calculate_conduit_thermal_resistances(
 
     # R4 - earth thermal resistance (from conduit OD)
     # Using Neher-McGrath formula with conduit diameter
-    rho_soil = conduit.soil_resistivity
+    k_soil = conduit.soil_resistivity * _INV_TWO_PI
     L = conduit.depth * 1000  # Convert m to mm
     D_e = conduit.conduit_od_mm  # mm
 
-    u = 2 * L / D_e
-    if u > 10:
-        r4 = (rho_soil / (2 * math.pi)) * math.log(4 * L / D_e)
-    else:
-        r4 = (rho_soil / (2 * math.pi)) * math.log(u + math.sqrt(u ** 2 - 1))
+    r4 = k_soil * _neher_mcgrath_log(L, D_e)
 
     # Mutual heating for multiple conduits
     f_mutual = 1.0
     if conduit.num_conduits > 1 and conduit.spacing > 0:
         s = conduit.spacing  # m
         L_m = conduit.depth  # m
-        d_pk = s
-        d_pk_image = math.sqrt(s ** 2 + (2 * L_m) ** 2)
-        delta_f = (rho_soil / (2 * math.pi)) * math.log(d_pk_image / d_pk)
-        f_mutual = 1 + (conduit.num_conduits - 1) * delta_f / r4
+        delta_f = k_soil * _image_log_ratio(s, 2 * L_m)
+        if r4 > 0:
+            f_mutual = 1 + (conduit.num_conduits - 1) * delta_f / r4
 
     r4_effective = r4 * f_mutual
     total = r1 + r2 + r3 + r4_effective
@@ -1201,8 +1379,6 @@ def calculate_duct_position_coordinates(
     Returns:
         List of (row, col, x, y) tuples for each duct
     """
-    positions = []
-
     # Bank center depth (from top of bank)
     bank_center_y = duct_bank.depth + duct_bank.bank_height / 2
 
@@ -1213,13 +1389,11 @@ def calculate_duct_position_coordinates(
     start_x = -total_width / 2
     start_y = bank_center_y - total_height / 2
 
-    for row in range(duct_bank.duct_rows):
-        for col in range(duct_bank.duct_cols):
-            x = start_x + col * duct_bank.duct_spacing_h
-            y = start_y + row * duct_bank.duct_spacing_v
-            positions.append((row, col, x, y))
+    # Column x and row y coordinates, combined in row-major order
+    xs = [start_x + col * duct_bank.duct_spacing_h for col in range(duct_bank.duct_cols)]
+    ys = [start_y + row * duct_bank.duct_spacing_v for row in range(duct_bank.duct_rows)]
 
-    return positions
+    return [(row, col, x, y) for row, y in enumerate(ys) for col, x in enumerate(xs)]
 
 
 def calculate_iec_geometric_factor(
@@ -1271,10 +1445,10 @@ def calculate_iec_geometric_factor(
     # G = (1/π) × [ln(2d_top/r) + ln(2d_bottom/r) + ln(2d_left/r) + ln(2d_right/r)] / 4
     #
     # Simplified: G = ln(geometric_mean_of_2d_i/r)
-    # where geometric_mean = (2d_top × 2d_bottom × 2d_left × 2d_right)^0.25
+    # where geometric_mean = (2d_top × 2d_bottom × 2d_left × 2d_right)^0.25,
+    # evaluated as ¼ ln(2d_top × 2d_bottom × 2d_left × 2d_right) - ln(r)
 
-    geometric_mean = (2 * d_top * 2 * d_bottom * 2 * d_left * 2 * d_right) ** 0.25
-    G = math.log(geometric_mean / r_duct)
+    G = 0.25 * math.log(2 * d_top * 2 * d_bottom * 2 * d_left * 2 * d_right) - math.log(r_duct)
 
     # Apply correction for aspect ratio of the bank
     # Wide shallow banks vs narrow deep banks have different thermal behavior
@@ -1327,7 +1501,7 @@ def calculate_multiregion_thermal_resistance(
     )
 
     rho_concrete = duct_bank.concrete_resistivity
-    r_concrete = (rho_concrete / (2 * math.pi)) * G
+    r_concrete = rho_concrete * _INV_TWO_PI * G
 
     # R_soil from bank surface to remote ground
     # Use equivalent diameter approach per IEC 60287-2-1
@@ -1338,13 +1512,7 @@ def calculate_multiregion_thermal_resistance(
     L_eq = duct_bank.depth + duct_bank.bank_height / 2
 
     # External thermal resistance using Neher-McGrath formula
-    u = 2 * L_eq / D_eq
-    if u > 10:
-        r_soil = (duct_bank.soil_resistivity / (2 * math.pi)) * math.log(4 * L_eq / D_eq)
-    else:
-        r_soil = (duct_bank.soil_resistivity / (2 * math.pi)) * math.log(
-            u + math.sqrt(max(u ** 2 - 1, 0.01))
-        )
+    r_soil = duct_bank.soil_resistivity * _INV_TWO_PI * _neher_mcgrath_log(L_eq, D_eq, clamp=True)
 
     details = {
         "G_factor": G,
@@ -1410,6 +1578,55 @@ def calculate_duct_geometric_factor(
     return d_mean
 
 
+def _duct_index(duct: tuple, rows: int, cols: int) -> Optional[int]:
+    """
+    Return the index of duct (row, col) in calculate_duct_position_coordinates() output.
+
+    Positions are generated in row-major order. Returns None for a duct
+    outside the bank.
+    """
+    row, col = duct[0], duct[1]
+    if 0 <= row < rows and 0 <= col < cols:
+        return row * cols + col
+    return None
+
+
+def _ductbank_mutual_sum(
+    x: float,
+    y: float,
+    others: list,
+    soil_resistivity: float,
+) -> float:
+    """
+    Sum the image-method mutual heating terms at (x, y) from other ducts.
+
+    Args:
+        x: Target duct X position (m)
+        y: Target duct Y position (depth, m)
+        others: List of (x, y) positions of the other occupied ducts
+        soil_resistivity: Native soil thermal resistivity (K·m/W)
+
+    Returns:
+        Additional thermal resistance due to mutual heating (K·m/W)
+    """
+    total_log = 0.0
+    for ox, oy in others:
+        dx2 = (x - ox) ** 2
+
+        # Squared distance between ducts
+        d2_pk = dx2 + (y - oy) ** 2
+        d2_pk = max(d2_pk, 1e-4)  # Avoid division by zero (d_pk >= 0.01 m)
+
+        # Squared distance to image of other duct
+        d2_pk_image = dx2 + (y + oy) ** 2
+
+        # ln(d'_pk / d_pk) = ½ln(d'_pk² / d_pk²)
+        if d2_pk_image > d2_pk:
+            total_log += math.log(d2_pk_image / d2_pk)
+
+    return soil_resistivity * _INV_TWO_PI * 0.5 * total_log
+
+
 def calculate_ductbank_thermal_resistances(
     geometry: CableGeometry,
     duct_bank: DuctBankConditions,
@@ -1453,16 +1670,11 @@ def calculate_ductbank_thermal_resistances(
         target_duct = (bottom_row, center_col)
 
     # Find target duct position
-    target_pos = None
-    for pos in positions:
-        if pos[0] == target_duct[0] and pos[1] == target_duct[1]:
-            target_pos = pos
-            break
-
-    if target_pos is None:
-        target_pos = positions[0]  # Fallback
+    target_idx = _duct_index(target_duct, duct_bank.duct_rows, duct_bank.duct_cols)
+    if target_idx is None:
+        target_idx = 0  # Fallback
 
-    _, _, x, y = target_pos
+    _, _, x, y = positions[target_idx]
 
     # Use IEC 60287-2-1 multi-region thermal resistance calculation
     r_concrete, r4, thermal_details = calculate_multiregion_thermal_resistance(
@@ -1478,32 +1690,17 @@ def calculate_ductbank_thermal_resistances(
 
     if len(occupied) > 1:
         # Calculate mutual heating from other occupied ducts
-        total_mutual = 0.0
+        others = []
         for occ in occupied:
             if occ == target_duct:
                 continue
             # Find position of this occupied duct
-            occ_pos = None
-            for pos in positions:
-                if pos[0] == occ[0] and pos[1] == occ[1]:
-                    occ_pos = pos
-                    break
-            if occ_pos is None:
-                continue
-
-            _, _, ox, oy = occ_pos
-
-            # Distance between ducts
-            d_pk = math.sqrt((x - ox) ** 2 + (y - oy) ** 2)
-            d_pk = max(d_pk, 0.01)  # Avoid division by zero
-
-            # Distance to image of other duct
-            d_pk_image = math.sqrt((x - ox) ** 2 + (y + oy) ** 2)
+            occ_idx = _duct_index(occ, duct_bank.duct_rows, duct_bank.duct_cols)
+            if occ_idx is not None:
+                _, _, ox, oy = positions[occ_idx]
+                others.append((ox, oy))
 
-            # Mutual heating contribution
-            if d_pk_image > d_pk:
-                mutual_contrib = (duct_bank.soil_resistivity / (2 * math.pi)) * math.log(d_pk_image / d_pk)
-                total_mutual += mutual_contrib
+        total_mutual = _ductbank_mutual_sum(x, y, others, duct_bank.soil_resistivity)
 
         if r4 > 0:
             f_mutual = 1 + total_mutual / r4
@@ -283,10 +283,10 @@ def run_cymcap_comparison():
         frequency=CYMCAP_CABLE_DATA["frequency_hz"],
     )
 
-    print(f"DC resistance at 90°C: {ac_res['rdc']*1e6:.4f} µΩ/m")
-    print(f"Skin effect factor (Ycs): {ac_res['ycs']:.6f}")
-    print(f"Proximity effect factor (Ycp): {ac_res['ycp']:.6f}")
-    print(f"AC resistance at 90°C: {ac_res['rac']*1e6:.4f} µΩ/m")
+    print(f"DC resistance at 90°C: {ac_res.rdc*1e6:.4f} µΩ/m")
+    print(f"Skin effect factor (Ycs): {ac_res.ycs:.6f}")
+    print(f"Proximity effect factor (Ycp): {ac_res.ycp:.6f}")
+    print(f"AC resistance at 90°C: {ac_res.rac*1e6:.4f} µΩ/m")
 
     # ========================================================================
     # Calculate Dielectric Loss
@@ -407,7 +407,7 @@ def run_cymcap_comparison():
         geometry=geometry,
         cable_positions=cable_positions,
         duct_bank=duct_bank,
-        conductor_rac=ac_res["rac"],
+        conductor_rac=ac_res.rac,
         dielectric_loss=wd,
         lambda1=lambda1,
         max_temp=CYMCAP_CABLE_DATA["max_steady_state_temp_c"],
@@ -10,6 +10,7 @@ Expected results: 384-489 A depending on position
 """
 
 import pytest
+import collections
 import math
 
 from cable_ampacity.ac_resistance import ConductorSpec, calculate_ac_resistance
@@ -100,6 +101,37 @@ CYMCAP_EXPECTED_RESULTS = {
 }
 
 
+def _cymcap_conductor():
+    """Segmental copper conductor from the CYMCAP validation case."""
+    return ConductorSpec(
+        material="copper",
+        cross_section=CYMCAP_CONDUCTOR["cross_section_mm2"],
+        diameter=CYMCAP_CONDUCTOR["diameter_mm"],
+        stranding="segmental",
+        ks=CYMCAP_CONDUCTOR["ks"],
+        kp=CYMCAP_CONDUCTOR["kp"],
+    )
+
+
+def _cymcap_insulation(material="xlpe"):
+    """Insulation with the CYMCAP validation case dimensions."""
+    return InsulationSpec(
+        material=material,
+        thickness=CYMCAP_INSULATION["thickness_mm"],
+        conductor_diameter=CYMCAP_CONDUCTOR["diameter_mm"],
+    )
+
+
+def _cymcap_cable(insulation_material="xlpe"):
+    """Unshielded CYMCAP validation cable."""
+    return CableSpec(conductor=_cymcap_conductor(), insulation=_cymcap_insulation(insulation_material))
+
+
+def _cymcap_operating():
+    """345 kV (199.2 kV phase-to-ground), 60 Hz operating conditions."""
+    return OperatingConditions(voltage=199.2, frequency=60.0)
+
+
 class TestCYMCAPValidation:
     """Test class for CYMCAP validation."""
 
@@ -237,6 +269,19 @@ class TestCYMCAPValidation:
         # Should have some mutual heating from adjacent cable
         assert r_mutual > 0
 
+    def test_all_mutual_heating_matches_per_cable(self):
+        """All-cables mutual heating matches per-target calls."""
+        from cable_ampacity.thermal_resistance import calculate_all_mutual_heating
+
+        all_cables = [
+            CablePosition(x=0.0, y=1.5, circuit_id=1, phase="A"),
+            CablePosition(x=0.3, y=1.5, circuit_id=1, phase="B"),
+            CablePosition(x=0.15, y=1.25, circuit_id=1, phase="C"),
+        ]
+
+        expected = [calculate_cable_mutual_heating(c, all_cables, 1.0, 500) for c in all_cables]
+        assert calculate_all_mutual_heating(all_cables, 1.0) == expected
+
     def test_effective_soil_resistivity_with_layers(self):
         """Test effective soil resistivity calculation with multiple layers."""
         layers = [
@@ -410,5 +455,323 @@ class TestCYMCAPValidation:
         print("Difference due to: mutual heating from 35 other cables, duct thermal resistance")
 
 
+    def test_ac_resistance_result_access(self):
+        """AC resistance result supports attribute and tuple access."""
+        conductor = _cymcap_conductor()
+
+        result = calculate_ac_resistance(conductor, temperature=90.0)
+        rdc, ycs, ycp, rac = result
+
+        assert result.rac == result[3] == rac
+        assert result.to_dict() == {"rdc": rdc, "ycs": ycs, "ycp": ycp, "rac": rac}
+        assert rac == pytest.approx(rdc * (1 + ycs + ycp))
+
+
+    def test_temperature_rise_from_loss_result(self):
+        """calculate_losses output feeds calculate_temperature_rise directly."""
+        from cable_ampacity.losses import calculate_losses
+        from cable_ampacity.thermal_resistance import (
+            BurialConditions,
+            calculate_temperature_rise,
+            calculate_thermal_resistances,
+        )
+
+        insulation = _cymcap_insulation()
+        geometry = CableGeometry(
+            conductor_diameter=CYMCAP_CONDUCTOR["diameter_mm"],
+            insulation_thickness=CYMCAP_INSULATION["thickness_mm"],
+            shield_thickness=1.0,
+            jacket_thickness=4.0,
+        )
+        burial = BurialConditions(depth=1.5, soil_resistivity=1.0, ambient_temp=25.0)
+
+        losses = calculate_losses(1000.0, 1e-5, insulation, 199.2)
+        thermal = calculate_thermal_resistances(geometry, burial)
+        rise = calculate_temperature_rise(losses, thermal)
+
+        assert rise == calculate_temperature_rise(losses.to_dict(), thermal)
+        assert rise["delta_t_conductor"] == pytest.approx(
+            losses.wc * (thermal["r1"] + thermal["r2"] + thermal["r4_effective"])
+        )
+
+    def test_shield_loss_factor_batch_matches_scalar(self):
+        """Batch shield loss factor matches per-frequency scalar calls."""
+        from cable_ampacity.losses import (
+            calculate_shield_loss_factor,
+            calculate_shield_loss_factor_batch,
+        )
+        frequencies = [60.0, 180.0, 300.0, 420.0]
+        racs = [3.0e-5, 3.5e-5, 4.0e-5, 4.5e-5]
+
+        for bonding in ("single_point", "both_ends", "cross_bonded"):
+            shield = ShieldSpec(
+                material="copper",
+                type="wire",
+                thickness=1.0,
+                mean_diameter=90.0,
+                bonding=bonding,
+            )
+
+            batch = calculate_shield_loss_factor_batch(shield, racs, 300.0, frequencies)
+
+            for lam, freq, rac in zip(batch, frequencies, racs):
+                assert lam == pytest.approx(calculate_shield_loss_factor(shield, rac, 300.0, freq))
+
+
+    def test_report_batch_archive(self, tmp_path):
+        """Batch report generation can collect reports into one zip archive."""
+        import zipfile
+        from cable_ampacity.thermal_resistance import BurialConditions
+        from cable_ampacity.report_generator import generate_qaqc_reports_batch
+
+        cable = _cymcap_cable()
+        operating = _cymcap_operating()
+
+        jobs = []
+        for depth in (1.0, 1.5, 2.0):
+            installation = BurialConditions(depth=depth, soil_resistivity=1.0, ambient_temp=25.0)
+            results = calculate_ampacity(cable, installation, operating)
+            jobs.append((cable, installation, operating, results, f"report_{depth}.md"))
+
+        archive = tmp_path / "reports.zip"
+        names = generate_qaqc_reports_batch(jobs, archive_path=str(archive))
+
+        assert names == ["report_1.0.md", "report_1.5.md", "report_2.0.md"]
+        with zipfile.ZipFile(archive) as zf:
+            assert zf.namelist() == names
+            assert zf.read(names[0]).decode("utf-8").startswith("# Cable Ampacity QA/QC Calculation Report")
+
+        # Rendering in worker processes writes the same reports, in job order
+        parallel_archive = tmp_path / "reports_parallel.zip"
+        assert generate_qaqc_reports_batch(jobs, archive_path=str(parallel_archive), max_workers=2) == names
+        with zipfile.ZipFile(archive) as serial, zipfile.ZipFile(parallel_archive) as parallel:
+            assert parallel.namelist() == names
+            for name in names:
+                serial_text = serial.read(name).decode("utf-8")
+                parallel_text = parallel.read(name).decode("utf-8")
+                # Only the generation timestamp may differ
+                assert serial_text.split("| Software Version")[1] == parallel_text.split("| Software Version")[1]
+
+    def test_report_failure_keeps_existing_file(self, tmp_path):
+        """A report that fails to render leaves the previous file untouched."""
+        from cable_ampacity.thermal_resistance import BurialConditions
+        from cable_ampacity.report_generator import generate_qaqc_report
+
+        cable = _cymcap_cable()
+        operating = _cymcap_operating()
+        installation = BurialConditions(depth=1.5, soil_resistivity=1.0, ambient_temp=25.0)
+        results = calculate_ampacity(cable, installation, operating)
+
+        report = tmp_path / "report.md"
+        generate_qaqc_report(cable, installation, operating, results, str(report))
+        good_report = report.read_bytes()
+
+        incomplete = dict(results)
+        del incomplete["losses"]
+        with pytest.raises(KeyError):
+            generate_qaqc_report(cable, installation, operating, incomplete, str(report))
+
+        assert report.read_bytes() == good_report
+        assert [p.name for p in tmp_path.iterdir()] == ["report.md"]
+
+    def test_intermediate_values_from_results(self, tmp_path):
+        """Intermediate values derived from solver results match the report."""
+        from cable_ampacity.ac_resistance import TEMPERATURE_COEFFICIENT
+        from cable_ampacity.report_generator import generate_qaqc_report
+        from cable_ampacity.solver import calculate_intermediate_values
+        from cable_ampacity.thermal_resistance import BurialConditions
+
+        cable = _cymcap_cable()
+        operating = _cymcap_operating()
+        installation = BurialConditions(depth=1.5, soil_resistivity=1.0, ambient_temp=25.0)
+
+        results = calculate_ampacity(cable, installation, operating)
+        assert "intermediate" not in results
+        intermediate = calculate_intermediate_values(cable, operating, results)
+        rdc = results["ac_resistance"]["rdc"]
+
+        assert intermediate["xs_squared"] == pytest.approx(8 * math.pi * 60.0 / rdc * 1e-7 * CYMCAP_CONDUCTOR["ks"])
+        assert intermediate["xs"] ** 2 == pytest.approx(intermediate["xs_squared"])
+        assert intermediate["rdc_20"] < rdc
+        # Capacitance ties back to the dielectric loss: Wd = ωC·U₀²·tanδ
+        u0 = operating.voltage * 1000
+        assert intermediate["omega"] * intermediate["capacitance"] * u0 * u0 * 0.001 == pytest.approx(
+            results["losses"]["dielectric"]
+        )
+
+        # Paper-oil is rated at 85°C: rdc_20 and the report both use the solver's temperature
+        paper_cable = _cymcap_cable(insulation_material="paper_oil")
+        results = calculate_ampacity(paper_cable, installation, operating)
+        t_max = results["max_conductor_temp"]
+        alpha = TEMPERATURE_COEFFICIENT["copper"]
+        assert t_max == 85
+        intermediate = calculate_intermediate_values(paper_cable, operating, results)
+        assert intermediate["rdc_20"] * (1 + alpha * (t_max - 20)) == pytest.approx(
+            results["ac_resistance"]["rdc"]
+        )
+
+        report = tmp_path / "paper_oil.md"
+        generate_qaqc_report(paper_cable, installation, operating, results, str(report))
+        text = report.read_text(encoding="utf-8")
+        assert "R_DC(85°C)" in text
+        assert "R_DC(90°C)" not in text
+
+    def test_ampacity_batch_broadcasts_shared_specs(self):
+        """Batch ampacity matches scalar calls, broadcasting single specs."""
+        from cable_ampacity.solver import calculate_ampacity_batch
+        from cable_ampacity.thermal_resistance import BurialConditions
+
+        cable = _cymcap_cable()
+        operating = _cymcap_operating()
+        installations = [
+            BurialConditions(depth=depth, soil_resistivity=1.0, ambient_temp=25.0)
+            for depth in (1.0, 1.5, 2.0)
+        ]
+
+        batch = calculate_ampacity_batch(cable, installations, operating)
+
+        assert len(batch) == 3
+        for installation, result in zip(installations, batch):
+            assert result["ampacity"] == calculate_ampacity(cable, installation, operating)["ampacity"]
+
+        # Operating-condition sweep over one installation
+        operatings = [OperatingConditions(voltage=199.2, frequency=60.0, load_factor=lf) for lf in (0.6, 0.8, 1.0)]
+        sweep = calculate_ampacity_batch(cable, installations[0], operatings)
+        for operating_point, result in zip(operatings, sweep):
+            expected = calculate_ampacity(cable, installations[0], operating_point)
+            assert result["ampacity_cyclic"] == expected["ampacity_cyclic"]
+
+        # Worker processes return the same results, in scenario order
+        parallel = calculate_ampacity_batch(cable, installations, operating, max_workers=2)
+        assert [r["ampacity"] for r in parallel] == [r["ampacity"] for r in batch]
+
+        # Any sequence type is per-scenario input, not just list/tuple
+        deque_batch = calculate_ampacity_batch(cable, collections.deque(installations), operating)
+        assert [r["ampacity"] for r in deque_batch] == [r["ampacity"] for r in batch]
+
+        with pytest.raises(ValueError):
+            calculate_ampacity_batch([cable, cable], installations, operating)
+
+    def test_thermal_resistances_batch_matches_scalar(self):
+        """Batch and grid thermal resistances match per-scenario calls."""
+        from cable_ampacity.thermal_resistance import (
+            BurialConditions,
+            calculate_thermal_resistances,
+            calculate_thermal_resistances_batch,
+            calculate_thermal_resistances_grid,
+        )
+
+        geometry = CableGeometry(
+            conductor_diameter=CYMCAP_CONDUCTOR["diameter_mm"],
+            insulation_thickness=CYMCAP_INSULATION["thickness_mm"],
+            shield_thickness=1.0,
+            jacket_thickness=4.0,
+        )
+        burials = [
+            BurialConditions(depth=depth, soil_resistivity=rho, ambient_temp=25.0, spacing=0.3, num_circuits=2)
+            for depth in (0.3, 1.0, 2.0)
+            for rho in (0.9, 1.5)
+        ]
+
+        batch = calculate_thermal_resistances_batch(geometry, burials)
+
+        assert len(batch) == len(burials)
+        for burial, result in zip(burials, batch):
+            assert result == calculate_thermal_resistances(geometry, burial)
+
+        # Any sequence type is per-scenario input, not just list/tuple
+        assert calculate_thermal_resistances_batch(geometry, collections.deque(burials)) == batch
+
+        with pytest.raises(ValueError):
+            calculate_thermal_resistances_batch([geometry, geometry], burials)
+
+        # Depth x soil resistivity grid, with and without mutual heating
+        depths = (0.3, 1.0, 2.0)
+        rhos = (0.9, 1.5)
+        for spacing, num_circuits in ((0.3, 2), (0.0, 1)):
+            grid = calculate_thermal_resistances_grid(geometry, depths, rhos, spacing, num_circuits)
+            assert len(grid) == len(depths)
+            for depth, row in zip(depths, grid):
+                assert len(row) == len(rhos)
+                for rho, cell in zip(rhos, row):
+                    burial = BurialConditions(
+                        depth=depth, soil_resistivity=rho, ambient_temp=25.0,
+                        spacing=spacing, num_circuits=num_circuits,
+                    )
+                    assert cell == calculate_thermal_resistances(geometry, burial)
+
+    def test_shallow_duct_bank_warns(self):
+        """Equivalent depth below the bank radius warns instead of silently clamping."""
+        from cable_ampacity.thermal_resistance import calculate_multiregion_thermal_resistance
+
+        duct_bank = DuctBankConditions(
+            depth=0.0, soil_resistivity=1.0, concrete_resistivity=1.0, ambient_temp=25.0,
+            bank_width=4.0, bank_height=0.5, duct_rows=1, duct_cols=1,
+            duct_spacing_h=0.3, duct_spacing_v=0.3, duct_id_mm=150, duct_od_mm=170,
+        )
+
+        with pytest.warns(RuntimeWarning):
+            _, r_soil, _ = calculate_multiregion_thermal_resistance(0.0, 0.25, 170, duct_bank)
+        assert r_soil == 0.0
+
+        # End to end: the earth term is zero rather than the negative
+        # ln(u + 0.1) of the old clamp, which rated this bank at 2353.5 A
+        cable = _cymcap_cable()
+        operating = _cymcap_operating()
+
+        with pytest.warns(RuntimeWarning):
+            results = calculate_ampacity(cable, duct_bank, operating)
+        assert results["thermal_resistance"]["r4_earth"] == 0.0
+        assert results["ampacity"] == pytest.approx(2196.4, abs=0.1)
+
+    def test_shallow_burial_and_conduit_raise(self):
+        """Depth below the cable/conduit radius is rejected outside duct banks."""
+        from cable_ampacity.thermal_resistance import (
+            BurialConditions,
+            ConduitConditions,
+            calculate_conduit_thermal_resistances,
+            calculate_thermal_resistances,
+            calculate_thermal_resistances_grid,
+        )
+
+        geometry = CableGeometry(
+            conductor_diameter=60.0,
+            insulation_thickness=15.0,
+            shield_thickness=2.5,
+            jacket_thickness=2.5,
+        )
+        burial = BurialConditions(depth=0.02, soil_resistivity=1.0, ambient_temp=25.0)
+        conduit = ConduitConditions(
+            depth=0.05, soil_resistivity=1.0, ambient_temp=25.0,
+            conduit_id_mm=150, conduit_od_mm=170,
+        )
+
+        with pytest.raises(ValueError):
+            calculate_thermal_resistances(geometry, burial)
+        with pytest.raises(ValueError):
+            calculate_conduit_thermal_resistances(geometry, conduit)
+
+        # Same with several circuits/conduits: a ValueError, not a ZeroDivisionError
+        burial.spacing, burial.num_circuits = 0.3, 2
+        conduit.spacing, conduit.num_conduits = 0.3, 3
+        with pytest.raises(ValueError):
+            calculate_thermal_resistances(geometry, burial)
+        with pytest.raises(ValueError):
+            calculate_conduit_thermal_resistances(geometry, conduit)
+
+        # Depth equal to the radius (u = 1) gives R4 = 0 and no mutual heating factor
+        burial.depth = 0.05
+        conduit.depth, conduit.conduit_od_mm = 0.05, 100.0
+        assert calculate_thermal_resistances(geometry, burial)["f_mutual"] == 1.0
+        assert calculate_conduit_thermal_resistances(geometry, conduit)["f_mutual"] == 1.0
+
+        # The depth x soil grid follows the same rules as the scalar path
+        assert calculate_thermal_resistances_grid(geometry, [0.05], [1.0], 0.3, 2) == [
+            [calculate_thermal_resistances(geometry, burial)]
+        ]
+        with pytest.raises(ValueError):
+            calculate_thermal_resistances_grid(geometry, [0.02], [1.0], 0.3, 2)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])